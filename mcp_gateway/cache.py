@@ -0,0 +1,133 @@
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from mcp import types
+from pydantic import ValidationError
+
+# Seconds a cached capability listing stays fresh; unset or 0 disables the cache
+CACHE_TTL_ENV = "MCP_GATEWAY_CAPS_CACHE_TTL"
+CACHE_DIR = (
+    Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache"))
+    / "mcp-gateway"
+    / "caps"
+)
+# Bump when the stored layout changes so old files are ignored
+_CACHE_VERSION = 1
+
+logger = logging.getLogger(__name__)
+
+
+def cache_ttl() -> float:
+    """Returns the capability cache TTL in seconds, or 0 if caching is disabled."""
+    value = os.environ.get(CACHE_TTL_ENV, "")
+    try:
+        return max(float(value), 0.0) if value else 0.0
+    except ValueError:
+        logger.warning("Ignoring invalid %s value: %r", CACHE_TTL_ENV, value)
+        return 0.0
+
+
+def cache_path(config: Dict[str, Any]) -> Path:
+    """Returns the cache file for a proxied server invocation.
+
+    The file name is a hash of the command, arguments and environment, so any
+    change to how the server is launched misses the cache.
+
+    Args:
+        config: The proxied server configuration (command, args, env).
+
+    Returns:
+        Path of the JSON cache file for this invocation.
+    """
+    key = json.dumps(
+        [
+            config.get("command", ""),
+            list(config.get("args") or []),
+            sorted((config.get("env") or {}).items()),
+        ]
+    )
+    digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).hexdigest()
+    return CACHE_DIR / f"{digest}.json"
+
+
+def load_capabilities(
+    config: Dict[str, Any],
+) -> Optional[Tuple[List[types.Tool], List[types.Resource], List[types.Prompt]]]:
+    """Loads cached capabilities for a server if caching is enabled and fresh.
+
+    Args:
+        config: The proxied server configuration (command, args, env).
+
+    Returns:
+        A (tools, resources, prompts) tuple, or None on a miss, an expired
+        entry, or an entry that no longer matches the MCP schema.
+    """
+    ttl = cache_ttl()
+    if not ttl:
+        return None
+
+    path = cache_path(config)
+    try:
+        if time.time() - path.stat().st_mtime > ttl:
+            return None
+        with open(path, "r") as f:
+            data = json.load(f)
+        if data.get("version") != _CACHE_VERSION:
+            return None
+        return (
+            [types.Tool.model_validate(item) for item in data["tools"]],
+            [types.Resource.model_validate(item) for item in data["resources"]],
+            [types.Prompt.model_validate(item) for item in data["prompts"]],
+        )
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError, KeyError, TypeError, ValidationError) as e:
+        logger.debug("Ignoring unusable capability cache %s: %s", path, e)
+        return None
+
+
+def save_capabilities(
+    config: Dict[str, Any],
+    tools: Sequence[types.Tool],
+    resources: Sequence[types.Resource],
+    prompts: Sequence[types.Prompt],
+) -> None:
+    """Writes a server's capabilities to the cache if caching is enabled.
+
+    The file is replaced atomically so concurrent gateways never read a
+    partially written entry.
+
+    Args:
+        config: The proxied server configuration (command, args, env).
+        tools: The tools listed by the server.
+        resources: The resources listed by the server.
+        prompts: The prompts listed by the server.
+    """
+    if not cache_ttl():
+        return
+
+    path = cache_path(config)
+    data = {
+        "version": _CACHE_VERSION,
+        "tools": [item.model_dump(mode="json") for item in tools],
+        "resources": [item.model_dump(mode="json") for item in resources],
+        "prompts": [item.model_dump(mode="json") for item in prompts],
+    }
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(data, f)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except OSError as e:
+        logger.warning("Could not write capability cache %s: %s", path, e)
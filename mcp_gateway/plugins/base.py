@@ -8,6 +8,15 @@ logger = logging.getLogger(__name__)
 class PluginContext:
     """Holds contextual information for plugin execution."""
 
+    __slots__ = (
+        "server_name",
+        "capability_type",
+        "capability_name",
+        "arguments",
+        "response",
+        "mcp_context",
+    )
+
     def __init__(
         self,
         server_name: str,
@@ -24,7 +33,10 @@ class PluginContext:
         self.response = response
         self.mcp_context = mcp_context
         logger.debug(
-            f"PluginContext created for {server_name}/{capability_type}/{capability_name}"
+            "PluginContext created for %s/%s/%s",
+            server_name,
+            capability_type,
+            capability_name,
         )
 
     def to_dict(self) -> Dict[str, Any]:
@@ -117,7 +129,10 @@ class TracingPlugin(Plugin, abc.ABC):
     def process_request(self, context: PluginContext) -> Optional[Dict[str, Any]]:
         """Trace/log request data. Should generally not modify arguments."""
         logger.debug(
-            f"Tracing request: {context.server_name}/{context.capability_type}/{context.capability_name}"
+            "Tracing request: %s/%s/%s",
+            context.server_name,
+            context.capability_type,
+            context.capability_name,
         )
         # Return original arguments by default
         return context.arguments
@@ -125,7 +140,10 @@ class TracingPlugin(Plugin, abc.ABC):
     def process_response(self, context: PluginContext) -> Any:
         """Trace/log response data. Should generally not modify the response."""
         logger.debug(
-            f"Tracing response: {context.server_name}/{context.capability_type}/{context.capability_name}"
+            "Tracing response: %s/%s/%s",
+            context.server_name,
+            context.capability_type,
+            context.capability_name,
         )
         # Return original response by default
         return context.response
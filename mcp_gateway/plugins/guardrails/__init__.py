@@ -1,15 +1,33 @@
 """Guardrail plugins for MCP Gateway.
 
 These plugins help protect the system by validating and modifying requests/responses.
+Plugin modules are imported lazily, so only enabled plugins pay their import cost.
 """
 
-# Import all plugins to ensure they register
-from mcp_gateway.plugins.guardrails.basic import BasicGuardrailPlugin
-from mcp_gateway.plugins.guardrails.lasso import LassoGuardrailPlugin
-from mcp_gateway.plugins.guardrails.presidio import PresidioGuardrailPlugin
+import importlib
+from typing import Any
 
-__all__ = [
-    "BasicGuardrailPlugin",
-    "LassoGuardrailPlugin",
-    "PresidioGuardrailPlugin",
-]
+# Plugin name -> module that registers the plugin (in registration order)
+_PLUGIN_MODULES = {
+    "basic": "mcp_gateway.plugins.guardrails.basic",
+    "lasso": "mcp_gateway.plugins.guardrails.lasso",
+    "presidio": "mcp_gateway.plugins.guardrails.presidio",
+}
+
+# Exported class name -> plugin name
+_PLUGIN_CLASSES = {
+    "BasicGuardrailPlugin": "basic",
+    "LassoGuardrailPlugin": "lasso",
+    "PresidioGuardrailPlugin": "presidio",
+}
+
+__all__ = list(_PLUGIN_CLASSES)
+
+
+def __getattr__(name: str) -> Any:
+    """Imports plugin classes on first access."""
+    plugin_name = _PLUGIN_CLASSES.get(name)
+    if plugin_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(_PLUGIN_MODULES[plugin_name])
+    return getattr(module, name)
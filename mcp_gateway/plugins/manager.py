@@ -1,6 +1,22 @@
+import asyncio
+import functools
+import importlib
 import inspect
 import logging
-from typing import Any, Dict, List, Optional, Type, TypeVar
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+)
 
 from mcp_gateway.plugins.base import (
     Plugin,
@@ -14,18 +30,87 @@ logger = logging.getLogger(__name__)
 # Type variable for plugins
 PluginT = TypeVar("PluginT", bound=Plugin)
 
-# Plugin registry to store all registered plugins
-_PLUGIN_REGISTRY: Dict[str, List[Type[Plugin]]] = {
-    GuardrailPlugin.plugin_type: [],
-    TracingPlugin.plugin_type: [],
+# Plugin registry to store all registered plugins. Values are tuples that are
+# replaced (never mutated) on registration, so they can be safely shared.
+_PLUGIN_REGISTRY: Dict[str, Tuple[Type[Plugin], ...]] = {
+    GuardrailPlugin.plugin_type: (),
+    TracingPlugin.plugin_type: (),
 }
 
+
+@dataclass(frozen=True, slots=True)
+class PluginInfo:
+    """Registry entry describing a registered plugin class."""
+
+    plugin_type: str
+    plugin_class: Type[Plugin]
+
+    def __getitem__(self, key: str) -> Any:
+        """Supports the info["type"] / info["class"] access of the former dict entries.
+
+        Args:
+            key: "type" or "class".
+
+        Returns:
+            The plugin type or plugin class.
+
+        Raises:
+            KeyError: For any other key.
+        """
+        if key == "type":
+            return self.plugin_type
+        if key == "class":
+            return self.plugin_class
+        raise KeyError(key)
+
+
 # Plugin name to class mapping - helps with lookups
-_PLUGIN_NAME_TO_INFO: Dict[str, Dict[str, Any]] = {}
+_PLUGIN_NAME_TO_INFO: Dict[str, PluginInfo] = {}
 
-# Flag to track if plugins have been discovered
+# Read-only view of the name mapping for lookups
+_PLUGIN_NAME_TO_INFO_VIEW: Mapping[str, PluginInfo] = MappingProxyType(
+    _PLUGIN_NAME_TO_INFO
+)
+
+# Flag to track if all plugins have been discovered
 _PLUGINS_DISCOVERED = False
 
+# Marker returned by _run_plugin when a plugin hook raised
+_PLUGIN_FAILED = object()
+
+# Packages holding the built-in plugins of each type. Each package maps plugin
+# names to the modules that register them, so modules can be imported lazily.
+_PLUGIN_PACKAGES: Dict[str, str] = {
+    GuardrailPlugin.plugin_type: "mcp_gateway.plugins.guardrails",
+    TracingPlugin.plugin_type: "mcp_gateway.plugins.tracing",
+}
+
+
+def _plugin_names(plugin_cls: Type[Plugin]) -> Tuple[str, str]:
+    """Returns the lowercase class name and plugin_name of a plugin class.
+
+    The result is cached on the class itself, so names are normalized once
+    per class rather than on every PluginManager construction. The name the
+    plugin is known by (plugin_name if set, else the class name) is cached
+    alongside as _resolved_name, derived from the same pair.
+
+    Args:
+        plugin_cls: The plugin class
+
+    Returns:
+        Tuple of (lowercase class name, lowercase plugin_name attribute)
+    """
+    # Read from the class __dict__ so subclasses don't inherit parent names
+    names = plugin_cls.__dict__.get("_normalized_names")
+    if names is None:
+        names = (
+            plugin_cls.__name__.lower(),
+            getattr(plugin_cls, "plugin_name", "").lower(),
+        )
+        plugin_cls._normalized_names = names
+        plugin_cls._resolved_name = names[1] or names[0]
+    return names
+
 
 def register_plugin(plugin_cls: Type[PluginT]) -> Type[PluginT]:
     """Decorator for registering plugin classes.
@@ -40,85 +125,165 @@ def register_plugin(plugin_cls: Type[PluginT]) -> Type[PluginT]:
 
     if not plugin_type:
         logger.warning(
-            f"Plugin {plugin_cls.__name__} has no plugin_type. Skipping registration."
+            "Plugin %s has no plugin_type. Skipping registration.", plugin_cls.__name__
         )
         return plugin_cls
 
-    # Add plugin type to registry if not exists
-    if plugin_type not in _PLUGIN_REGISTRY:
-        _PLUGIN_REGISTRY[plugin_type] = []
-
     # Register the plugin class
-    _PLUGIN_REGISTRY[plugin_type].append(plugin_cls)
+    _PLUGIN_REGISTRY[plugin_type] = _PLUGIN_REGISTRY.get(plugin_type, ()) + (
+        plugin_cls,
+    )
 
     # Store both class name and plugin_name attribute as lookup keys
-    plugin_class_name = plugin_cls.__name__.lower()
-    _PLUGIN_NAME_TO_INFO[plugin_class_name] = {
-        "type": plugin_type,
-        "class": plugin_cls,
-    }
+    # (one shared, immutable entry serves both keys)
+    plugin_class_name, plugin_attr_name = _plugin_names(plugin_cls)
+    plugin_info = PluginInfo(plugin_type=plugin_type, plugin_class=plugin_cls)
+    _PLUGIN_NAME_TO_INFO[plugin_class_name] = plugin_info
 
     # Also register by plugin_name attribute if different
-    plugin_attr_name = getattr(plugin_cls, "plugin_name", "").lower()
     if plugin_attr_name and plugin_attr_name != plugin_class_name:
-        _PLUGIN_NAME_TO_INFO[plugin_attr_name] = {
-            "type": plugin_type,
-            "class": plugin_cls,
-        }
+        _PLUGIN_NAME_TO_INFO[plugin_attr_name] = plugin_info
 
-    logger.info(f"Registered plugin: {plugin_cls.__name__} (type: {plugin_type})")
+    logger.info("Registered plugin: %s (type: %s)", plugin_cls.__name__, plugin_type)
+
+    # A new name may now resolve, so drop memoized lookups
+    get_plugin_type.cache_clear()
 
     return plugin_cls
 
 
-def discover_plugins():
-    """Discover plugins by importing plugin modules via their __init__.py files.
+def _builtin_plugin_modules(plugin_type: Optional[str] = None) -> Dict[str, str]:
+    """Maps lowercase plugin and class names to the modules that register them.
+
+    Args:
+        plugin_type: Restrict the mapping to built-in plugins of this type
+
+    Returns:
+        Dictionary of lowercase name to module path, in registration order
+    """
+    modules: Dict[str, str] = {}
+    for package_type, package_name in _PLUGIN_PACKAGES.items():
+        if plugin_type is not None and package_type != plugin_type:
+            continue
+        # The package __init__ only holds the name mappings; it is cheap to import
+        package = importlib.import_module(package_name)
+        for name, module_name in package._PLUGIN_MODULES.items():
+            modules[name.lower()] = module_name
+        for class_name, name in package._PLUGIN_CLASSES.items():
+            modules[class_name.lower()] = package._PLUGIN_MODULES[name]
+    return modules
+
+
+def discover_plugins(
+    plugin_names: Optional[Iterable[str]] = None,
+    plugin_type: Optional[str] = None,
+) -> None:
+    """Discover plugins by importing the modules that register them.
+
+    Built-in plugin modules are imported lazily: when plugin_names is given only
+    the modules providing those plugins are imported, so a gateway running just
+    'basic' never imports heavy dependencies of other plugins.
 
-    This simplified approach relies on the imports already defined in the package __init__.py files
-    rather than using dynamic module discovery.
+    Args:
+        plugin_names: Names (plugin_name or class name) of plugins to import.
+                      If None or containing 'all', every built-in plugin is imported.
+        plugin_type: Restrict discovery to built-in plugins of this type
     """
     global _PLUGINS_DISCOVERED
 
     if _PLUGINS_DISCOVERED:
         return
 
-    logger.debug("Discovering plugins...")
+    wanted = None
+    if plugin_names is not None:
+        wanted = {name.lower() for name in plugin_names}
+        if "all" in wanted:
+            wanted = None
 
-    # Import plugin packages to trigger registration via their __init__.py files
-    # The __init__.py files should already import all plugin modules
-    try:
-        import mcp_gateway.plugins.guardrails
-        import mcp_gateway.plugins.tracing
+    logger.debug("Discovering plugins...")
 
-        logger.info(f"Discovered {len(_PLUGIN_NAME_TO_INFO)} plugins")
+    modules = _builtin_plugin_modules(plugin_type)
+    module_names = list(
+        dict.fromkeys(
+            module_name
+            for name, module_name in modules.items()
+            if wanted is None or name in wanted
+        )
+    )
+
+    failed = False
+    for module_name in module_names:
+        try:
+            importlib.import_module(module_name)
+        except ImportError as e:
+            logger.error("Failed to import plugin module %s: %s", module_name, e)
+            failed = True
+
+    logger.info("Discovered %s plugins", len(_PLUGIN_NAME_TO_INFO))
+    if wanted is None and plugin_type is None and not failed:
         _PLUGINS_DISCOVERED = True
-    except ImportError as e:
-        logger.error(f"Failed to import plugin packages: {e}")
 
 
+@functools.lru_cache(maxsize=None)
 def get_plugin_type(plugin_name: str) -> Optional[str]:
     """Get the plugin type for a given plugin name.
 
+    Results, including unknown names, are memoized until the next plugin
+    registration.
+
     Args:
         plugin_name: The name of the plugin to look up
 
     Returns:
         The plugin type or None if not found
     """
-    # Make sure plugins are discovered
-    discover_plugins()
-
     # Normalize the plugin name
     plugin_name_lower = plugin_name.lower()
 
+    # Import the plugin's module if it has not been registered yet
+    if plugin_name_lower not in _PLUGIN_NAME_TO_INFO_VIEW:
+        discover_plugins([plugin_name_lower])
+
     # Look up the plugin type
-    plugin_info = _PLUGIN_NAME_TO_INFO.get(plugin_name_lower)
+    plugin_info = _PLUGIN_NAME_TO_INFO_VIEW.get(plugin_name_lower)
     if plugin_info:
-        return plugin_info["type"]
+        return plugin_info.plugin_type
 
     return None
 
 
+async def _run_plugin(
+    fn: Callable[[PluginContext], Any],
+    is_async: bool,
+    context: PluginContext,
+    label: str,
+) -> Any:
+    """Runs a single plugin hook, logging any error it raises.
+
+    Args:
+        fn: The bound plugin hook (process_request or process_response)
+        is_async: Whether the hook is a coroutine function
+        context: The plugin context to pass to the hook
+        label: Phase description used in error logs (e.g. 'guardrail request')
+
+    Returns:
+        The hook's result, or _PLUGIN_FAILED if it raised
+    """
+    try:
+        if is_async:
+            return await fn(context)
+        return fn(context)
+    except Exception as e:
+        logger.error(
+            "Error in %s plugin %s: %s",
+            label,
+            fn.__self__.__class__.__name__,
+            e,
+            exc_info=True,
+        )
+        return _PLUGIN_FAILED
+
+
 class PluginManager:
     """Manages plugins using the Registry Pattern."""
 
@@ -136,18 +301,77 @@ class PluginManager:
                           (e.g., {'guardrail': ['basic', 'lasso']}).
                           If a type has an empty list or contains 'all', all plugins of that type are enabled.
         """
-        # Ensure plugins are discovered before initialization
-        discover_plugins()
-
         self.enabled_types = enabled_types or []
         self.enabled_plugins = enabled_plugins or {}
 
+        # Ensure the enabled plugins are discovered before initialization.
+        # Only their modules are imported; an empty list means all of the type.
+        if not _PLUGINS_DISCOVERED:
+            for plugin_type in self.enabled_types:
+                discover_plugins(
+                    self.enabled_plugins.get(plugin_type) or None, plugin_type
+                )
+
         # Dictionary to store instantiated plugin objects
         self._plugins: Dict[str, List[Plugin]] = {}
 
+        # Bound hook methods per phase, resolved once after loading.
+        # Tracing hooks are split by sync/async since they only observe;
+        # guardrail hooks keep their load order because each one consumes
+        # the output of the previous one.
+        self._trace_req_async: List[Callable[[PluginContext], Any]] = []
+        self._trace_req_sync: List[Callable[[PluginContext], Any]] = []
+        self._trace_resp_async: List[Callable[[PluginContext], Any]] = []
+        self._trace_resp_sync: List[Callable[[PluginContext], Any]] = []
+        self._guard_req: List[Tuple[Callable[[PluginContext], Any], bool]] = []
+        self._guard_resp: List[Tuple[Callable[[PluginContext], Any], bool]] = []
+
         # Load enabled plugins
         self._load_plugins()
 
+        # Direct references to the loaded plugin lists of the built-in types
+        self._tracing_plugins: List[Plugin] = self._plugins.get(
+            TracingPlugin.plugin_type, []
+        )
+        self._guardrail_plugins: List[Plugin] = self._plugins.get(
+            GuardrailPlugin.plugin_type, []
+        )
+
+        self._bind_hooks()
+
+        # Fast-path flags so phases without plugins are skipped entirely
+        self._has_trace_req = bool(self._trace_req_async or self._trace_req_sync)
+        self._has_trace_resp = bool(self._trace_resp_async or self._trace_resp_sync)
+        self._has_guard_req = bool(self._guard_req)
+        self._has_guard_resp = bool(self._guard_resp)
+
+        # Whether any plugin hooks each phase; callers can skip sanitizing
+        # entirely when these are False. Resource reads use the response phase.
+        self.has_request_sanitizers = self._has_trace_req or self._has_guard_req
+        self.has_response_sanitizers = self._has_trace_resp or self._has_guard_resp
+
+        # Specialize dispatch for the loaded plugin set: when a phase has no
+        # hooks at all, bind a passthrough that skips context allocation
+        if not self.has_request_sanitizers:
+            self.process_request = self._passthrough_request
+        if not self.has_response_sanitizers:
+            self.process_response = self._passthrough_response
+
+        # Every loaded plugin applies to every capability, so all capabilities
+        # share one pipeline; resolve it once here instead of per call
+        self._pipeline = (
+            (
+                *self._trace_req_async,
+                *self._trace_req_sync,
+                *(fn for fn, _ in self._guard_req),
+            ),
+            (
+                *self._trace_resp_async,
+                *self._trace_resp_sync,
+                *(fn for fn, _ in self._guard_resp),
+            ),
+        )
+
     def _load_plugins(self) -> None:
         """Load and instantiate all enabled plugins from the registry."""
         if not self.enabled_types:
@@ -161,34 +385,29 @@ class PluginManager:
         # Load enabled plugin types
         for plugin_type in self.enabled_types:
             if plugin_type not in _PLUGIN_REGISTRY:
-                logger.warning(f"Unknown plugin type: {plugin_type}")
+                logger.warning("Unknown plugin type: %s", plugin_type)
                 continue
 
-            # Get enabled plugin names for this type
-            enabled_names = self.enabled_plugins.get(plugin_type, [])
-            load_all_of_type = not enabled_names or "all" in enabled_names
+            # Normalize enabled plugin names for this type once
+            wanted = frozenset(
+                name.lower() for name in self.enabled_plugins.get(plugin_type, [])
+            )
+            load_all_of_type = not wanted or "all" in wanted
 
             # Load plugins of this type
             for plugin_cls in _PLUGIN_REGISTRY[plugin_type]:
                 # Try matching by class name or plugin_name attribute
-                plugin_name = plugin_cls.__name__.lower()
-                plugin_attr_name = getattr(plugin_cls, "plugin_name", "").lower()
-
-                # Check if plugin should be loaded
-                should_load = load_all_of_type
-                if not should_load:
-                    for enabled in enabled_names:
-                        enabled_lower = enabled.lower()
-                        if (
-                            enabled_lower == plugin_name
-                            or enabled_lower == plugin_attr_name
-                        ):
-                            should_load = True
-                            break
+                plugin_name, plugin_attr_name = _plugin_names(plugin_cls)
+                should_load = (
+                    load_all_of_type
+                    or plugin_name in wanted
+                    or plugin_attr_name in wanted
+                )
 
                 if not should_load:
                     logger.debug(
-                        f"Skipping plugin {plugin_cls.__name__} - not explicitly enabled"
+                        "Skipping plugin %s - not explicitly enabled",
+                        plugin_cls.__name__,
                     )
                     continue
 
@@ -198,18 +417,54 @@ class PluginManager:
                     plugin_instance.load({})  # Empty config by default
                     self._plugins[plugin_type].append(plugin_instance)
                     logger.info(
-                        f"Loaded plugin: {plugin_cls.__name__} (type: {plugin_type})"
+                        "Loaded plugin: %s (type: %s)", plugin_cls.__name__, plugin_type
                     )
                 except Exception as e:
                     logger.error(
-                        f"Failed to load plugin {plugin_cls.__name__}: {e}",
+                        "Failed to load plugin %s: %s",
+                        plugin_cls.__name__,
+                        e,
                         exc_info=True,
                     )
 
         # Log summary of loaded plugins
         for p_type, p_list in self._plugins.items():
             if p_type in self.enabled_types:
-                logger.info(f"Loaded {len(p_list)} plugins of type '{p_type}'")
+                logger.info("Loaded %s plugins of type '%s'", len(p_list), p_type)
+
+    def _bind_hooks(self) -> None:
+        """Resolve the hook methods of loaded plugins into per-phase lists.
+
+        Doing this once keeps type lookups and coroutine introspection out of
+        the per-request loops.
+        """
+        for plugin in self._tracing_plugins:
+            for fn, async_hooks, sync_hooks in (
+                (plugin.process_request, self._trace_req_async, self._trace_req_sync),
+                (
+                    plugin.process_response,
+                    self._trace_resp_async,
+                    self._trace_resp_sync,
+                ),
+            ):
+                if inspect.iscoroutinefunction(fn):
+                    async_hooks.append(fn)
+                else:
+                    sync_hooks.append(fn)
+
+        for plugin in self._guardrail_plugins:
+            self._guard_req.append(
+                (
+                    plugin.process_request,
+                    inspect.iscoroutinefunction(plugin.process_request),
+                )
+            )
+            self._guard_resp.append(
+                (
+                    plugin.process_response,
+                    inspect.iscoroutinefunction(plugin.process_response),
+                )
+            )
 
     def get_plugins(self, plugin_type: str) -> List[Plugin]:
         """Returns loaded plugins of a specific type.
@@ -220,8 +475,43 @@ class PluginManager:
         Returns:
             List of loaded plugins of the specified type
         """
+        if plugin_type == TracingPlugin.plugin_type:
+            return self._tracing_plugins
+        if plugin_type == GuardrailPlugin.plugin_type:
+            return self._guardrail_plugins
         return self._plugins.get(plugin_type, [])
 
+    def get_pipeline(self, server_name: str, capability_type: str, name: str) -> Tuple[
+        Tuple[Callable[[PluginContext], Any], ...],
+        Tuple[Callable[[PluginContext], Any], ...],
+    ]:
+        """Returns the request and response hooks applying to a capability.
+
+        The pipeline is resolved once per manager, since no plugin is scoped
+        to particular capabilities. process_request and process_response run
+        these hooks with the right ordering and sync/async handling.
+
+        Args:
+            server_name: The name of the proxied server.
+            capability_type: The type of capability ('tool', 'resource', 'prompt').
+            name: The name of the capability.
+
+        Returns:
+            A (request hooks, response hooks) tuple; a phase's hooks are empty
+            when no plugin hooks it, so callers can skip that phase.
+        """
+        return self._pipeline
+
+    async def _passthrough_request(
+        self, context: PluginContext
+    ) -> Optional[Dict[str, Any]]:
+        """Request dispatch used when no request hooks are loaded."""
+        return context.arguments
+
+    async def _passthrough_response(self, context: PluginContext) -> Any:
+        """Response dispatch used when no response hooks are loaded."""
+        return context.response
+
     async def process_request(self, context: PluginContext) -> Optional[Dict[str, Any]]:
         """Processes a request through all relevant plugins.
 
@@ -233,50 +523,43 @@ class PluginManager:
         """
         current_args = context.arguments
 
-        # Run Tracing plugins (for monitoring)
-        for plugin in self.get_plugins(TracingPlugin.plugin_type):
-            try:
-                context_for_plugin = PluginContext(
-                    server_name=context.server_name,
-                    capability_type=context.capability_type,
-                    capability_name=context.capability_name,
-                    arguments=current_args,
-                    mcp_context=context.mcp_context,
-                )
+        # A single context is shared by all plugins of this call; only the
+        # arguments are rebound between guardrails
+        plugin_context = PluginContext(
+            context.server_name,
+            context.capability_type,
+            context.capability_name,
+            current_args,
+            None,
+            context.mcp_context,
+        )
 
-                if inspect.iscoroutinefunction(plugin.process_request):
-                    await plugin.process_request(context_for_plugin)
-                else:
-                    plugin.process_request(context_for_plugin)
-            except Exception as e:
-                logger.error(
-                    f"Error in tracing request plugin {plugin.__class__.__name__}: {e}",
-                    exc_info=True,
+        # Run Tracing plugins (for monitoring)
+        if self._has_trace_req:
+            # Tracing plugins only observe, so async ones can run concurrently
+            if self._trace_req_async:
+                await asyncio.gather(
+                    *(
+                        _run_plugin(fn, True, plugin_context, "tracing request")
+                        for fn in self._trace_req_async
+                    )
                 )
+            for fn in self._trace_req_sync:
+                await _run_plugin(fn, False, plugin_context, "tracing request")
 
         # Run Guardrail plugins (can modify or block)
-        for plugin in self.get_plugins(GuardrailPlugin.plugin_type):
-            if current_args is None:  # If a previous guardrail blocked
-                break
-
-            try:
-                context_for_plugin = PluginContext(
-                    server_name=context.server_name,
-                    capability_type=context.capability_type,
-                    capability_name=context.capability_name,
-                    arguments=current_args,
-                    mcp_context=context.mcp_context,
+        if self._has_guard_req and current_args is not None:
+            for fn, is_async in self._guard_req:
+                plugin_context.arguments = current_args
+                result = await _run_plugin(
+                    fn, is_async, plugin_context, "guardrail request"
                 )
+                if result is _PLUGIN_FAILED:
+                    continue
 
-                if inspect.iscoroutinefunction(plugin.process_request):
-                    current_args = await plugin.process_request(context_for_plugin)
-                else:
-                    current_args = plugin.process_request(context_for_plugin)
-            except Exception as e:
-                logger.error(
-                    f"Error in guardrail request plugin {plugin.__class__.__name__}: {e}",
-                    exc_info=True,
-                )
+                current_args = result
+                if current_args is None:  # Blocked, skip remaining guardrails
+                    return None
 
         return current_args
 
@@ -291,48 +574,39 @@ class PluginManager:
         """
         current_response = context.response
 
-        # Run Guardrail plugins for response (can modify)
-        for plugin in self.get_plugins(GuardrailPlugin.plugin_type):
-            try:
-                context_for_plugin = PluginContext(
-                    server_name=context.server_name,
-                    capability_type=context.capability_type,
-                    capability_name=context.capability_name,
-                    arguments=context.arguments,
-                    response=current_response,
-                    mcp_context=context.mcp_context,
-                )
+        # A single context is shared by all plugins of this call; only the
+        # response is rebound between guardrails
+        plugin_context = PluginContext(
+            context.server_name,
+            context.capability_type,
+            context.capability_name,
+            context.arguments,
+            current_response,
+            context.mcp_context,
+        )
 
-                if inspect.iscoroutinefunction(plugin.process_response):
-                    current_response = await plugin.process_response(context_for_plugin)
-                else:
-                    current_response = plugin.process_response(context_for_plugin)
-            except Exception as e:
-                logger.error(
-                    f"Error in guardrail response plugin {plugin.__class__.__name__}: {e}",
-                    exc_info=True,
+        # Run Guardrail plugins for response (can modify)
+        if self._has_guard_resp:
+            for fn, is_async in self._guard_resp:
+                plugin_context.response = current_response
+                result = await _run_plugin(
+                    fn, is_async, plugin_context, "guardrail response"
                 )
+                if result is not _PLUGIN_FAILED:
+                    current_response = result
 
         # Run Tracing plugins for response (for monitoring)
-        for plugin in self.get_plugins(TracingPlugin.plugin_type):
-            try:
-                context_for_plugin = PluginContext(
-                    server_name=context.server_name,
-                    capability_type=context.capability_type,
-                    capability_name=context.capability_name,
-                    arguments=context.arguments,
-                    response=current_response,
-                    mcp_context=context.mcp_context,
-                )
-
-                if inspect.iscoroutinefunction(plugin.process_response):
-                    await plugin.process_response(context_for_plugin)
-                else:
-                    plugin.process_response(context_for_plugin)
-            except Exception as e:
-                logger.error(
-                    f"Error in tracing response plugin {plugin.__class__.__name__}: {e}",
-                    exc_info=True,
+        if self._has_trace_resp:
+            plugin_context.response = current_response
+            # Tracing plugins only observe, so async ones can run concurrently
+            if self._trace_resp_async:
+                await asyncio.gather(
+                    *(
+                        _run_plugin(fn, True, plugin_context, "tracing response")
+                        for fn in self._trace_resp_async
+                    )
                 )
+            for fn in self._trace_resp_sync:
+                await _run_plugin(fn, False, plugin_context, "tracing response")
 
         return current_response
@@ -1,9 +1,29 @@
 """Tracing plugins for MCP Gateway.
 
 These plugins help monitor system activity by logging requests and responses.
+Plugin modules are imported lazily, so only enabled plugins pay their import cost.
 """
 
-# Import all plugins to ensure they register
-from mcp_gateway.plugins.tracing.xetrack import XetrackTracingPlugin
+import importlib
+from typing import Any
 
-__all__ = ["XetrackTracingPlugin"]
+# Plugin name -> module that registers the plugin (in registration order)
+_PLUGIN_MODULES = {
+    "xetrack": "mcp_gateway.plugins.tracing.xetrack",
+}
+
+# Exported class name -> plugin name
+_PLUGIN_CLASSES = {
+    "XetrackTracingPlugin": "xetrack",
+}
+
+__all__ = list(_PLUGIN_CLASSES)
+
+
+def __getattr__(name: str) -> Any:
+    """Imports plugin classes on first access."""
+    plugin_name = _PLUGIN_CLASSES.get(name)
+    if plugin_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(_PLUGIN_MODULES[plugin_name])
+    return getattr(module, name)
@@ -42,7 +42,12 @@ async def sanitize_request(
     Returns:
         The sanitized arguments dictionary, or None if the request was blocked by a plugin.
     """
-    logger.debug(f"Running request plugins for {server_name}/{capability_type}/{name}")
+    if not plugin_manager.has_request_sanitizers:
+        return arguments
+
+    logger.debug(
+        "Running request plugins for %s/%s/%s", server_name, capability_type, name
+    )
     context = PluginContext(
         server_name=server_name,
         capability_type=capability_type,
@@ -57,7 +62,11 @@ async def sanitize_request(
         # Decide how to handle errors during plugin execution
         # Option 1: Log and block the request
         logger.error(
-            f"Error running request plugins for {server_name}/{capability_type}/{name}: {e}",
+            "Error running request plugins for %s/%s/%s: %s",
+            server_name,
+            capability_type,
+            name,
+            e,
             exc_info=True,
         )
         return None  # Block request on plugin error
@@ -94,7 +103,12 @@ async def sanitize_response(
     Returns:
         The sanitized response, potentially modified by plugins.
     """
-    logger.debug(f"Running response plugins for {server_name}/{capability_type}/{name}")
+    if not plugin_manager.has_response_sanitizers:
+        return response
+
+    logger.debug(
+        "Running response plugins for %s/%s/%s", server_name, capability_type, name
+    )
     context = PluginContext(
         server_name=server_name,
         capability_type=capability_type,
@@ -109,14 +123,22 @@ async def sanitize_response(
     except SanitizationError as se:
         # Allow specific SanitizationErrors from plugins to propagate
         logger.warning(
-            f"SanitizationError from response plugin for {server_name}/{capability_type}/{name}: {se}"
+            "SanitizationError from response plugin for %s/%s/%s: %s",
+            server_name,
+            capability_type,
+            name,
+            se,
         )
         raise se
     except Exception as e:
         # Decide how to handle general errors during response plugin execution
         # Option 1: Log and return original response (potentially revealing sensitive info)
         logger.error(
-            f"Error running response plugins for {server_name}/{capability_type}/{name}: {e}",
+            "Error running response plugins for %s/%s/%s: %s",
+            server_name,
+            capability_type,
+            name,
+            e,
             exc_info=True,
         )
         return response  # Return original response on error
@@ -144,7 +166,7 @@ async def sanitize_resource_read(
     mcp_context: Optional[Any] = None,
 ) -> Tuple[bytes, Optional[str]]:
     """Runs response plugins specifically for resource reads."""
-    logger.debug(f"Sanitizing resource read for {server_name} resource {uri}")
+    logger.debug("Sanitizing resource read for %s resource %s", server_name, uri)
     # Treat resource read as a 'response' phase
     response = (content, mime_type)
     sanitized_response = await sanitize_response(
@@ -165,7 +187,9 @@ async def sanitize_resource_read(
         return sanitized_response
     else:
         logger.error(
-            f"Response plugin for resource {uri} returned unexpected type {type(sanitized_response)}. Returning original."
+            "Response plugin for resource %s returned unexpected type %s. Returning original.",
+            uri,
+            type(sanitized_response),
         )
         return content, mime_type
 
@@ -176,10 +200,14 @@ async def sanitize_tool_call_args(
     tool_name: str,
     arguments: Optional[Dict[str, Any]],
     mcp_context: Optional[Any] = None,
-) -> Optional[Dict[str, Any]]:
-    """Runs request plugins specifically for tool calls."""
-    logger.info(f"Sanitizing tool call args for {server_name} tool {tool_name}")
-    return await sanitize_request(
+) -> Dict[str, Any]:
+    """Runs request plugins specifically for tool calls.
+
+    Raises:
+        SanitizationError: If a request plugin blocked the call.
+    """
+    logger.debug("Sanitizing tool call args for %s tool %s", server_name, tool_name)
+    sanitized_args = await sanitize_request(
         plugin_manager=plugin_manager,
         server_name=server_name,
         capability_type="tool",
@@ -187,6 +215,16 @@ async def sanitize_tool_call_args(
         arguments=arguments,
         mcp_context=mcp_context,
     )
+    if sanitized_args is None:
+        logger.warning(
+            "Tool call %s/%s blocked by request sanitizer plugin.",
+            server_name,
+            tool_name,
+        )
+        raise SanitizationError(
+            f"Request blocked by gateway policy for tool '{server_name}/{tool_name}'."
+        )
+    return sanitized_args
 
 
 async def sanitize_tool_call_result(
@@ -198,7 +236,7 @@ async def sanitize_tool_call_result(
     mcp_context: Optional[Any] = None,
 ) -> types.CallToolResult:
     """Runs response plugins specifically for tool call results."""
-    logger.info(f"Sanitizing tool call result for {server_name} tool {tool_name}")
+    logger.debug("Sanitizing tool call result for %s tool %s", server_name, tool_name)
 
     sanitized_result = await sanitize_response(
         plugin_manager=plugin_manager,
@@ -215,7 +253,9 @@ async def sanitize_tool_call_result(
         return sanitized_result
     else:
         logger.error(
-            f"Response plugin for tool {tool_name} returned unexpected type {type(sanitized_result)}. Returning original."
+            "Response plugin for tool %s returned unexpected type %s. Returning original.",
+            tool_name,
+            type(sanitized_result),
         )
         # Consider returning an error result instead?
         # return types.CallToolResult(outputs=[{"type": "error", "message": "Error message"}])
@@ -5,14 +5,20 @@ import os
 import json
 import argparse
 import sys
+import time
 from contextlib import asynccontextmanager, AsyncExitStack
 from dataclasses import dataclass, field
+from types import MappingProxyType
 from typing import (
     Any,
+    Awaitable,
+    Callable,
     Dict,
     AsyncIterator,
     List,
+    Mapping,
     Optional,
+    Sequence,
     Tuple,
     get_type_hints,
     get_args,
@@ -20,11 +26,16 @@ from typing import (
 )
 import inspect
 import functools
+import operator
 
 from mcp.server.fastmcp import FastMCP, Context
+from mcp.server.fastmcp.prompts import Prompt
 from mcp import ClientSession, StdioServerParameters, types
 from mcp.client.stdio import stdio_client
+import pydantic_core
+from pydantic import BaseModel, TypeAdapter
 
+from mcp_gateway.cache import cache_ttl, load_capabilities, save_capabilities
 from mcp_gateway.config import load_config
 from mcp_gateway.sanitizers import (
     SanitizationError,
@@ -37,14 +48,76 @@ from mcp_gateway.plugins.manager import PluginManager
 
 # --- Global Config for Args ---
 cli_args = None
-log_level = os.environ.get("LOGLEVEL", "INFO").upper()
 
-# Configure logging
-logging.basicConfig(
-    level=getattr(logging, log_level),
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-)
 logger = logging.getLogger(__name__)
+_logging_configured = False
+
+
+def _configure_logging() -> None:
+    """Configures root logging at the level named by the LOGLEVEL variable.
+
+    Only the CLI entrypoint main() may call this: it uses force=True to
+    replace the root handler that FastMCP installs when the module-level
+    gateway instance is created at import, which would also remove handlers
+    an embedding host had installed. Importing this module therefore does
+    configure logging, through FastMCP, but never through this function.
+    Only the first call has an effect.
+    """
+    global _logging_configured
+    if _logging_configured:
+        return
+    log_level = os.environ.get("LOGLEVEL", "INFO").upper()
+    # force: replace the default handler FastMCP installs when it is created
+    logging.basicConfig(
+        level=getattr(logging, log_level),
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+        force=True,
+    )
+    _logging_configured = True
+
+
+# Seconds a server's get_metadata entry may be reused without a rebuild
+METADATA_CACHE_TTL = 30.0
+# Minimum seconds between get_metadata error tracebacks logged per server
+METADATA_ERROR_TRACEBACK_INTERVAL = 60.0
+# Seconds each proxied server gets to stop before shutdown moves on
+SHUTDOWN_TIMEOUT = 5.0
+# Maximum number of proxied servers spawned at once during startup
+START_CONCURRENCY_ENV = "MCP_START_CONCURRENCY"
+DEFAULT_START_CONCURRENCY = 8
+
+# (session list method, result attribute, item type) of each capability list,
+# in the order they are stored as (tools, resources, prompts)
+_CAPABILITY_LISTS = (
+    ("list_tools", "tools", types.Tool),
+    ("list_resources", "resources", types.Resource),
+    ("list_prompts", "prompts", types.Prompt),
+)
+
+# Serialize a whole capability tuple in one pydantic-core call rather than
+# calling model_dump() per item
+_TOOLS_ADAPTER = TypeAdapter(Tuple[types.Tool, ...])
+_RESOURCES_ADAPTER = TypeAdapter(Tuple[types.Resource, ...])
+_PROMPTS_ADAPTER = TypeAdapter(Tuple[types.Prompt, ...])
+
+# Sentinel for attribute lookups where None is a meaningful value
+_MISSING = object()
+
+# Reads the GetewayContext off a request Context (or the low-level server)
+_lifespan_context = operator.attrgetter("request_context.lifespan_context")
+
+# Shared read-only stand-in for a missing mapping, so fallbacks don't allocate
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+
+# Strings at least this long are unlikely to repeat and aren't interned
+_MAX_INTERN_LENGTH = 4096
+
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    """Interns short strings so repeated names and descriptions share memory."""
+    if isinstance(value, str) and len(value) < _MAX_INTERN_LENGTH:
+        return sys.intern(value)
+    return value
 
 
 class Server:
@@ -57,20 +130,53 @@ class Server:
             name: The unique name identifier for this server.
             config: The configuration dictionary for this server (command, args, env).
         """
-        self.name = name
+        self.name = _intern(name)
         self.config = config
         self._session: Optional[ClientSession] = None
-        self._client_cm: Optional[
-            AsyncIterator[Tuple[asyncio.StreamReader, asyncio.StreamWriter]]
-        ] = None
+        # Task holding the stdio_client and ClientSession contexts open, and
+        # the event telling it to close them
+        self._session_task: Optional[asyncio.Task] = None
+        self._close_session: Optional[asyncio.Event] = None
         self._server_info: Optional[types.InitializeResult] = None
-        self._exit_stack = AsyncExitStack()
-        # Store fetched capabilities for easier access later
-        self._tools: List[types.Tool] = []
-        self._resources: List[types.Resource] = []
-        self._prompts: List[types.Prompt] = []
+        # Store fetched capabilities for easier access later. Tuples, so the
+        # cached lists can be shared by reference without risk of mutation
+        self._tools: Tuple[types.Tool, ...] = ()
+        self._resources: Tuple[types.Resource, ...] = ()
+        self._prompts: Tuple[types.Prompt, ...] = ()
+        self._capabilities_task: Optional[asyncio.Task] = None
+        # True when capabilities came from the disk cache and are being refreshed
+        self._capabilities_cached = False
+        # Awaited with (server, previous tools, previous prompts) when the
+        # background refresh finds that cached capabilities have changed
+        self.on_capabilities_refreshed: Optional[
+            Callable[
+                ["Server", Tuple[types.Tool, ...], Tuple[types.Prompt, ...]],
+                Awaitable[None],
+            ]
+        ] = None
+        # Bumped whenever server info or capability lists change, so derived
+        # data such as get_metadata output can tell when it is stale
+        self._capabilities_version = 0
+        # model_dump() output of the capabilities, built once per change
+        self._capabilities_dump: Optional[Dict[str, Any]] = None
+        self._tools_dump: List[Dict[str, Any]] = []
+        self._resources_dump: List[Dict[str, Any]] = []
+        self._prompts_dump: List[Dict[str, Any]] = []
+        # (version, timestamp, metadata) of the last get_metadata entry built
+        self._metadata_cache: Optional[Tuple[int, float, Dict[str, Any]]] = None
+        # When a get_metadata error traceback was last logged for this server
+        self._metadata_traceback_logged_at = float("-inf")
+        # Serializes connect() so concurrent first callers spawn one process
+        self._connect_lock = asyncio.Lock()
+        # Set by stop() so a start still in progress is not published
+        self._stopped = False
         logger.info(f"Initialized Proxied Server: {self.name}")
 
+    @property
+    def is_active(self) -> bool:
+        """Whether the server currently has an open client session."""
+        return self._session is not None
+
     @property
     def session(self) -> ClientSession:
         """Returns the active ClientSession, raising an error if not started."""
@@ -79,117 +185,300 @@ class Server:
         return self._session
 
     async def start(self) -> None:
+        """Starts the proxied server. Alias of connect() kept for the lifespan."""
+        await self.connect()
+
+    async def connect(self) -> ClientSession:
         """Starts the underlying MCP server process, establishes a client session,
-        and fetches initial capabilities."""
+        and schedules the initial capability fetch.
+
+        Idempotent: once connected, the existing session is returned without
+        spawning a new process. The capability fetch runs in the background so
+        other servers can finish their handshakes meanwhile; await ready()
+        before reading capabilities.
+
+        Returns:
+            The active ClientSession.
+        """
         if self._session is not None:
-            logger.warning(f"Server '{self.name}' already started.")
-            return
+            return self._session
+
+        async with self._connect_lock:
+            # Another caller may have connected while we waited for the lock
+            if self._session is None:
+                # Reset under the lock so a concurrent stop() is not undone
+                # before this start has even begun
+                self._stopped = False
+                await self._open_session()
+        return self._session
 
+    async def _open_session(self) -> None:
+        """Spawns the server process and initializes the client session."""
         logger.info(f"Starting proxied server: {self.name}...")
+        started = asyncio.get_running_loop().create_future()
+        self._close_session = asyncio.Event()
+        self._session_task = asyncio.create_task(
+            self._run_session(started, self._close_session)
+        )
         try:
-            server_params = StdioServerParameters(
-                command=self.config.get("command", ""),
-                args=self.config.get("args", []),
-                env=self.config.get("env", None),
-            )
-
-            # Use AsyncExitStack to manage the stdio_client context
-            self._client_cm = stdio_client(server_params)
-            read, write = await self._exit_stack.enter_async_context(self._client_cm)
-
-            # Use AsyncExitStack to manage the ClientSession context
-            session_cm = ClientSession(read, write)
-            self._session = await self._exit_stack.enter_async_context(session_cm)
-
-            # Capture and store the InitializeResult
-            self._server_info = await self._session.initialize()
+            # The session is only published once initialized, so concurrent
+            # connect() callers never get one still doing its handshake
+            session, self._server_info = await started
+            if self._stopped:
+                raise RuntimeError(f"Server '{self.name}' was stopped while starting.")
+            self._session = session
+            self._capabilities_changed()
             logger.info(
                 f"Proxied server '{self.name}' started and initialized successfully."
             )
 
-            # Fetch and store initial lists of tools, resources, prompts
-            await self._fetch_initial_capabilities()
+            # Serve capabilities from the disk cache when fresh; the fetch
+            # below then only refreshes them. The file I/O and parsing run in
+            # a worker thread so concurrent startups don't stall the loop
+            cached = None
+            if cache_ttl():
+                cached = await asyncio.to_thread(load_capabilities, self.config)
+            if cached is not None:
+                self._tools, self._resources, self._prompts = (
+                    tuple(items) for items in cached
+                )
+                self._capabilities_cached = True
+                self._capabilities_changed()
+                logger.info(
+                    f"Loaded cached capabilities for {self.name}, refreshing in background."
+                )
+
+            # Fetch initial lists of tools, resources, prompts in the background
+            self._capabilities_task = asyncio.create_task(
+                self._fetch_initial_capabilities()
+            )
 
         except Exception as e:
             logger.error(f"Failed to start server '{self.name}': {e}", exc_info=True)
             self._server_info = None  # Ensure server_info is None on failure
-            await self.stop()  # Attempt cleanup if start failed
+            await self.disconnect()  # Attempt cleanup if start failed
             raise
 
+    async def _run_session(
+        self, started: asyncio.Future, close_session: asyncio.Event
+    ) -> None:
+        """Holds the server process and client session open until closed.
+
+        stdio_client and ClientSession run anyio task groups, which must be
+        exited from the task that entered them. Both are therefore entered and
+        exited here, in a task owned by this server, rather than in whichever
+        task happened to call connect() or disconnect().
+
+        Args:
+            started: Resolved with (session, InitializeResult) once the
+                handshake is done, or with the error that prevented it.
+            close_session: Set by disconnect() to close the session.
+        """
+        server_params = StdioServerParameters(
+            command=self.config.get("command", ""),
+            args=self.config.get("args", []),
+            env=self.config.get("env", None),
+        )
+        try:
+            async with stdio_client(server_params) as (read, write):
+                async with ClientSession(read, write) as session:
+                    server_info = await session.initialize()
+                    started.set_result((session, server_info))
+                    await close_session.wait()
+        except asyncio.CancelledError:
+            if not started.done():
+                started.set_exception(
+                    RuntimeError(f"Server '{self.name}' was stopped while starting.")
+                )
+            raise
+        except Exception as e:
+            if not started.done():
+                started.set_exception(e)
+            else:
+                logger.error(
+                    "Session of proxied server '%s' failed: %s",
+                    self.name,
+                    e,
+                    exc_info=True,
+                )
+
+    async def _ensure_session(self) -> ClientSession:
+        """Returns the persistent session of the started server.
+
+        The call paths (call_tool, get_prompt, read_resource) must always go
+        through here and never open their own stdio_client: respawning the
+        server process and redoing the handshake per call is very slow.
+        Sessions are only opened by connect() from the gateway lifespan, never
+        lazily from a request.
+
+        Raises:
+            RuntimeError: If the server is not connected, e.g. because it has
+                been stopped while calls were still in flight.
+        """
+        if self._session is not None:
+            return self._session
+        if self._stopped:
+            raise RuntimeError(f"Server '{self.name}' has been stopped.")
+        raise RuntimeError(f"Server '{self.name}' is not connected.")
+
+    def _capabilities_changed(self) -> None:
+        """Records a change of server info or capability lists.
+
+        Bumps the capabilities version and re-serializes the capabilities once,
+        so metadata requests can reuse the dumps instead of calling
+        model_dump() per request.
+        """
+        self._capabilities_version += 1
+        capabilities = self._server_info.capabilities if self._server_info else None
+        self._capabilities_dump = capabilities.model_dump() if capabilities else None
+        self._tools_dump = list(_TOOLS_ADAPTER.dump_python(self._tools))
+        self._resources_dump = list(_RESOURCES_ADAPTER.dump_python(self._resources))
+        self._prompts_dump = list(_PROMPTS_ADAPTER.dump_python(self._prompts))
+
+    async def ready(self) -> None:
+        """Waits until the initial capability fetch scheduled by start() is done.
+
+        Returns immediately when capabilities were served from the disk cache.
+        """
+        if self._capabilities_task is not None and not self._capabilities_cached:
+            await self._capabilities_task
+
     async def _fetch_initial_capabilities(self):
         """Fetches and stores the initial lists of tools, resources, and prompts."""
-        if not self.session:
+        if not self.is_active:
             logger.warning(
-                f"Cannot fetch capabilities for {self.name}, session inactive."
+                "Cannot fetch capabilities for %s, session inactive.", self.name
             )
             return
 
+        # What the gateway registered from the disk cache, if anything
+        refreshing = self._capabilities_cached
+        previous_tools, previous_prompts = self._tools, self._prompts
+        previous_dumps = (self._tools_dump, self._prompts_dump)
         try:
-            # Fetch tools, resources, prompts simultaneously
-            tools_res, resources_res, prompts_res = await asyncio.gather(
-                self.session.list_tools(),
-                self.session.list_resources(),
-                self.session.list_prompts(),
-                return_exceptions=True,
-            )
-
-            # Process Tools
-            if isinstance(tools_res, Exception):
-                logger.debug(f"Failed to list tools for {self.name}: {tools_res}")
-                self._tools = []
-            else:
-                self._tools = self._extract_list(tools_res, "tools", types.Tool)
-
-            # Process Resources
-            if isinstance(resources_res, Exception):
-                logger.debug(
-                    f"Failed to list resources for {self.name}: {resources_res}"
+            # Fetch tools, resources, prompts simultaneously; each fetch handles
+            # its own errors and returns None if listing failed
+            session = self.session
+            listed = await asyncio.gather(
+                *(
+                    self._fetch_list(getattr(session, method), attr, item_type)
+                    for method, attr, item_type in _CAPABILITY_LISTS
                 )
-                self._resources = []
-            else:
-                self._resources = self._extract_list(
-                    resources_res, "resources", types.Resource
-                )
-
-            # Process Prompts
-            if isinstance(prompts_res, Exception):
-                logger.debug(f"Failed to list prompts for {self.name}: {prompts_res}")
-                self._prompts = []
-            else:
-                self._prompts = self._extract_list(prompts_res, "prompts", types.Prompt)
+            )
+            self._tools, self._resources, self._prompts = (
+                items or () for items in listed
+            )
+            self._capabilities_changed()
 
             logger.info(
-                f"Fetched initial capabilities for {self.name}: "
-                f"{len(self._tools)} tools, "
-                f"{len(self._resources)} resources, "
-                f"{len(self._prompts)} prompts."
+                "Fetched initial capabilities for %s: "
+                "%d tools, %d resources, %d prompts.",
+                self.name,
+                len(self._tools),
+                len(self._resources),
+                len(self._prompts),
+            )
+            # A failed listing would otherwise be cached as an empty one and
+            # served for the whole TTL on later starts
+            if cache_ttl() and all(items is not None for items in listed):
+                await asyncio.to_thread(
+                    save_capabilities,
+                    self.config,
+                    self._tools,
+                    self._resources,
+                    self._prompts,
+                )
+
+        except Exception as e:
+            logger.error(
+                "Unexpected error fetching capabilities for %s: %s",
+                self.name,
+                e,
+                exc_info=True,
             )
+            self._tools, self._resources, self._prompts = (), (), ()
+            self._capabilities_changed()
+            return
 
+        if not refreshing or previous_dumps == (self._tools_dump, self._prompts_dump):
+            return
+        if self.on_capabilities_refreshed is None:
+            logger.warning(
+                "Capabilities of %s changed since they were cached; "
+                "restart the gateway to expose the new ones.",
+                self.name,
+            )
+            return
+        logger.info(
+            "Capabilities of %s changed since they were cached; re-registering.",
+            self.name,
+        )
+        try:
+            await self.on_capabilities_refreshed(self, previous_tools, previous_prompts)
         except Exception as e:
             logger.error(
-                f"Unexpected error fetching capabilities for {self.name}: {e}",
+                "Failed to re-register refreshed capabilities for %s: %s",
+                self.name,
+                e,
                 exc_info=True,
             )
-            self._tools, self._resources, self._prompts = [], [], []
+
+    async def _fetch_list(
+        self, list_method: Any, attribute_name: str, expected_type: type
+    ) -> Optional[Tuple[Any, ...]]:
+        """Fetches one capability list, or None if listing it fails.
+
+        Args:
+            list_method: The session method listing the capability.
+            attribute_name: The result attribute holding the items.
+            expected_type: The MCP type of the listed items.
+
+        Returns:
+            The listed items, an empty tuple when the server did not advertise
+            the capability, or None on error.
+        """
+        # Skip the round trip for categories missing from the initialize
+        # result; list everything if the server reported no capabilities
+        capabilities = self._server_info.capabilities if self._server_info else None
+        if capabilities is not None and getattr(capabilities, attribute_name) is None:
+            logger.debug(
+                "Server '%s' does not advertise %s; not listing them.",
+                self.name,
+                attribute_name,
+            )
+            return ()
+        try:
+            result = await list_method()
+        except Exception as e:
+            logger.debug(f"Failed to list {attribute_name} for {self.name}: {e}")
+            return None
+        return tuple(self._extract_list(result, attribute_name, expected_type))
 
     def _extract_list(
         self, result: Any, attribute_name: str, expected_type: type
     ) -> List[Any]:
         """Helper to extract list of items from potentially structured MCP results."""
-        if hasattr(result, attribute_name):
-            items = getattr(result, attribute_name)
-        elif isinstance(result, list):
+        items = getattr(result, attribute_name, _MISSING)
+        # Typed MCP results were already validated by pydantic on receipt, so
+        # their items can be used by reference without per-item checks
+        if isinstance(result, BaseModel) and isinstance(items, list):
+            return items
+        if items is _MISSING:
+            if not isinstance(result, list):
+                logger.warning(
+                    f"Unexpected result type {type(result)} when extracting {attribute_name} for {self.name}"
+                )
+                return []
             items = result
-        else:
-            logger.warning(
-                f"Unexpected result type {type(result)} when extracting {attribute_name} for {self.name}"
-            )
-            return []
 
         if isinstance(items, list):
+            # MCP results are normally homogeneous, so skip the copy in that case
+            if all(type(item) is expected_type for item in items):
+                return items
             # Basic check if items are of the expected type (or can be treated as such)
             # More robust validation could be added here if needed
-            return [item for item in items if isinstance(item, expected_type)]
+            _isinstance = isinstance  # local lookup in the filter loop
+            return [item for item in items if _isinstance(item, expected_type)]
         else:
             logger.warning(
                 f"Extracted items for {attribute_name} is not a list for {self.name}: {type(items)}"
@@ -197,23 +486,67 @@ class Server:
             return []
 
     async def stop(self) -> None:
-        """Stops the underlying MCP server process and closes the client session."""
+        """Stops the proxied server for good.
+
+        Unlike a bare disconnect(), later calls are not allowed to reconnect
+        implicitly; only an explicit connect() starts the server again.
+        """
+        self._stopped = True
+        await self.disconnect()
+
+    async def disconnect(self) -> None:
+        """Stops the underlying MCP server process and closes the client session.
+
+        Safe to call when not connected, or more than once.
+        """
         logger.info(f"Stopping proxied server: {self.name}...")
-        await self._exit_stack.aclose()
-        self._session = None
-        self._client_cm = None
+        if self._capabilities_task is not None and not self._capabilities_task.done():
+            self._capabilities_task.cancel()
+        self._capabilities_task = None
+        self._capabilities_cached = False
+        session_task, close_session = self._session_task, self._close_session
+        self._session_task = self._close_session = None
+        published, self._session = self._session is not None, None
+        if session_task is not None:
+            # Close an established session gracefully; a start still in
+            # progress has nothing to close yet, so cancel it
+            if published:
+                close_session.set()
+            else:
+                session_task.cancel()
+            try:
+                await asyncio.wait((session_task,))
+            except asyncio.CancelledError:
+                # Cancelled ourselves (e.g. by a shutdown timeout); don't leave
+                # the session task running
+                session_task.cancel()
+                raise
         self._server_info = None  # Clear server info on stop
-        self._tools, self._resources, self._prompts = [], [], []  # Clear cached caps
+        self._tools, self._resources, self._prompts = (), (), ()  # Clear cached caps
+        self._capabilities_changed()
         logger.info(f"Proxied server '{self.name}' stopped.")
 
-    # --- MCP Interaction Methods (called by dynamic handlers) ---
+    # --- Cached capabilities ---
+    # Plain properties: the lists are fetched once, so reading them never awaits.
+    # For full dynamic support (listChanged), these would need to re-fetch.
 
-    async def list_prompts(self) -> List[types.Prompt]:
-        """Lists available prompts from the proxied server (uses cached list)."""
-        # Return the cached list fetched during startup/refresh
-        # For full dynamic support (listChanged), this would need to re-fetch
+    @property
+    def tools(self) -> Tuple[types.Tool, ...]:
+        """Tools available from the proxied server (cached list)."""
+        return self._tools
+
+    @property
+    def resources(self) -> Tuple[types.Resource, ...]:
+        """Resources available from the proxied server (cached list)."""
+        return self._resources
+
+    @property
+    def prompts(self) -> Tuple[types.Prompt, ...]:
+        """Prompts available from the proxied server (cached list)."""
         return self._prompts
 
+    # --- MCP Interaction Methods (called by dynamic handlers) ---
+
     async def get_prompt(
         self,
         plugin_manager: PluginManager,
@@ -222,10 +555,15 @@ class Server:
         mcp_context: Optional[Context] = None,
     ) -> types.GetPromptResult:
         """Gets a specific prompt from the proxied server, processing through plugins."""
-        logger.info(f"Getting prompt {self.name}/{name} with arguments {arguments}")
+        logger.debug(
+            "Getting prompt %s/%s with arguments %s", self.name, name, arguments
+        )
 
         # Use original arguments for the actual call
-        result = await self.session.get_prompt(name, arguments=arguments)
+        session = await self._ensure_session()
+        result = await session.get_prompt(name, arguments=arguments)
+        if not plugin_manager.get_pipeline(self.name, "prompt", name)[1]:
+            return result
 
         # Sanitize Response
         # Note: sanitize_response is designed generically. Ensure it handles GetPromptResult.
@@ -245,12 +583,18 @@ class Server:
                 return sanitized_result
             else:
                 logger.error(
-                    f"Response plugin for prompt {self.name}/{name} returned unexpected type {type(sanitized_result)}. Returning original."
+                    "Response plugin for prompt %s/%s returned unexpected type %s. Returning original.",
+                    self.name,
+                    name,
+                    type(sanitized_result),
                 )
                 return result  # Or potentially craft an error GetPromptResult
         except SanitizationError as se:
             logger.error(
-                f"Sanitization error processing prompt response for {self.name}/{name}: {se}"
+                "Sanitization error processing prompt response for %s/%s: %s",
+                self.name,
+                name,
+                se,
             )
             # Return an error message within the GetPromptResult structure
             return types.GetPromptResult(
@@ -265,7 +609,10 @@ class Server:
             )
         except Exception as e:
             logger.error(
-                f"Error processing prompt response for {self.name}/{name}: {e}",
+                "Error processing prompt response for %s/%s: %s",
+                self.name,
+                name,
+                e,
                 exc_info=True,
             )
             return types.GetPromptResult(
@@ -279,10 +626,6 @@ class Server:
                 ]
             )
 
-    async def list_resources(self) -> List[types.Resource]:
-        """Lists available resources from the proxied server (uses cached list)."""
-        return self._resources
-
     async def read_resource(
         self,
         plugin_manager: PluginManager,
@@ -292,7 +635,10 @@ class Server:
         """Reads a resource from the proxied server after processing through plugins."""
         # No request args to sanitize for read_resource itself
 
-        content, mime_type = await self.session.read_resource(uri)
+        session = await self._ensure_session()
+        content, mime_type = await session.read_resource(uri)
+        if not plugin_manager.get_pipeline(self.name, "resource", uri)[1]:
+            return content, mime_type
 
         # Sanitize the response content using the dedicated function
         sanitized_content, sanitized_mime_type = await sanitize_resource_read(
@@ -305,10 +651,6 @@ class Server:
         )
         return sanitized_content, sanitized_mime_type
 
-    async def list_tools(self) -> List[types.Tool]:
-        """Lists available tools from the proxied server (uses cached list)."""
-        return self._tools
-
     async def call_tool(
         self,
         plugin_manager: PluginManager,
@@ -316,29 +658,40 @@ class Server:
         arguments: Optional[Dict[str, Any]] = None,
         mcp_context: Optional[Context] = None,
     ) -> types.CallToolResult:
-        """Calls a tool on the proxied server after processing args and result through plugins."""
-        logger.debug(f"Calling tool {self.name}/{name}")
-        # 1. Sanitize request arguments
-        sanitized_args = await sanitize_tool_call_args(
-            plugin_manager=plugin_manager,
-            server_name=self.name,
-            tool_name=name,
-            arguments=arguments,
-            mcp_context=mcp_context,  # Pass gateway context
+        """Calls a tool on the proxied server after processing args and result through plugins.
+
+        Args:
+            plugin_manager: The plugin manager sanitizing the call.
+            name: The tool name on the proxied server.
+            arguments: The tool arguments.
+            mcp_context: The gateway request context passed to plugins.
+
+        Returns:
+            The (sanitized) tool result.
+        """
+        logger.debug("Calling tool %s/%s", self.name, name)
+        request_hooks, response_hooks = plugin_manager.get_pipeline(
+            self.name, "tool", name
         )
 
-        if sanitized_args is None:
-            # Handle blocked request appropriately
-            logger.warning(
-                f"Tool call {self.name}/{name} blocked by request sanitizer plugin."
-            )
-            # Raise specific error to be caught by dynamic handler
-            raise SanitizationError(
-                f"Request blocked by gateway policy for tool '{self.name}/{name}'."
+        # 1. Sanitize request arguments (skipped when no plugin hooks requests)
+        # A blocked request raises SanitizationError, caught by the dynamic handler
+        if not request_hooks:
+            sanitized_args = arguments
+        else:
+            sanitized_args = await sanitize_tool_call_args(
+                plugin_manager=plugin_manager,
+                server_name=self.name,
+                tool_name=name,
+                arguments=arguments,
+                mcp_context=mcp_context,  # Pass gateway context
             )
 
         # 2. Call the tool with sanitized arguments
-        result = await self.session.call_tool(name, arguments=sanitized_args)
+        session = await self._ensure_session()
+        result = await session.call_tool(name, arguments=sanitized_args)
+        if not response_hooks:
+            return result
 
         # 3. Sanitize the response result
         # Pass original request arguments for context if needed by plugins
@@ -377,6 +730,15 @@ class GetewayContext:
 
     proxied_servers: Dict[str, Server] = field(default_factory=dict)
     plugin_manager: Optional[PluginManager] = None
+    # Names of all configured servers, including ones that failed to start
+    configured_server_names: Tuple[str, ...] = ()
+    # (server capability versions, timestamp, result) of the last get_metadata
+    metadata_snapshot: Optional[Tuple[Tuple[Any, ...], float, Dict[str, Any]]] = None
+    # (metadata, get_metadata content) of the last full result rendered to JSON
+    metadata_content: Optional[Tuple[Dict[str, Any], types.TextContent]] = None
+    # Tool/prompt listings served to clients, built once after registration
+    gateway_tools_snapshot: Optional[Tuple[types.Tool, ...]] = None
+    gateway_prompts_snapshot: Optional[Tuple[types.Prompt, ...]] = None
     # Store dynamic capability handlers/metadata on the gateway context
     # Using FastMCP internal attributes is fragile, store here instead.
     # gateway_tools: Dict[str, Dict[str, Any]] = field(default_factory=dict) # For future use
@@ -386,8 +748,209 @@ class GetewayContext:
 
 # --- Dynamic Capability Registration ---
 
+# Maps JSON Schema types to the Python types used in handler signatures
+_JSON_TYPE_MAPPING = MappingProxyType(
+    {
+        "string": str,
+        "integer": int,
+        "boolean": bool,
+        "number": float,
+        "object": Dict[str, Any],
+        "array": List[Any],
+    }
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _qualified_name(server_name: str, capability_name: str) -> str:
+    """Returns the gateway-facing name of a proxied capability.
+
+    Args:
+        server_name: The name of the proxied server.
+        capability_name: The tool or prompt name on that server.
+
+    Returns:
+        The interned "<server>_<capability>" name.
+    """
+    return sys.intern(f"{server_name}_{capability_name}")
+
+
+@functools.lru_cache(maxsize=None)
+def _handler_signature(
+    param_types: Tuple[Tuple[str, Any], ...], return_type: Any
+) -> Tuple[inspect.Signature, Dict[str, Any]]:
+    """Builds the signature and annotations for a dynamic capability handler.
+
+    Cached by parameter shape, so proxied capabilities with identical
+    parameters share one Signature object.
+
+    Args:
+        param_types: Tuple of (parameter name, type annotation) pairs.
+        return_type: The return annotation of the handler.
+
+    Returns:
+        The handler signature and its annotations dictionary.
+    """
+    # Create parameters for the function signature
+    parameters = [
+        inspect.Parameter(
+            name="ctx",
+            annotation=Context,
+            kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+        )
+    ]
+
+    annotations = {"ctx": Context, "return": return_type}
+
+    # Add parameters from the original capability
+    for name, type_ann in param_types:
+        parameters.append(
+            inspect.Parameter(
+                name=name,
+                annotation=type_ann,
+                kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+            )
+        )
+        annotations[name] = type_ann
+
+    return inspect.Signature(parameters=parameters), annotations
+
+
+def _tool_error_result(
+    dynamic_tool_name: str, error_prefix: str, error: Exception
+) -> types.CallToolResult:
+    """Logs a failed dynamic tool call and wraps the error in a tool result.
+
+    Args:
+        dynamic_tool_name: The gateway-facing name of the tool.
+        error_prefix: The tool's error message prefix, formatted once when
+            the handler is created.
+        error: The exception raised while proxying the call.
+
+    Returns:
+        An error CallToolResult describing the failure.
+    """
+    if isinstance(error, SanitizationError):
+        logger.error(
+            "Sanitization policy violation for dynamic tool '%s': %s",
+            dynamic_tool_name,
+            error,
+        )
+        message = f"Gateway policy violation: {error}"
+    else:
+        logger.error("%s%s", error_prefix, error, exc_info=error)
+        message = error_prefix + str(error)
+    return types.CallToolResult(
+        content=[types.TextContent(type="text", text=message)], isError=True
+    )
+
+
+def _create_tool_handler(
+    server_name: str,
+    tool: types.Tool,
+    proxied_server: Server,
+    plugin_manager: PluginManager,
+    dynamic_tool_name: str,
+    param_signatures: List[Tuple[str, Any, str]],
+):
+    """Creates a properly typed handler proxying calls to a tool."""
+    # Formatted once here rather than on every failed call
+    error_prefix = f"Error executing dynamic tool '{dynamic_tool_name}': "
+
+    async def proxy_call(arguments: Dict[str, Any], ctx) -> types.CallToolResult:
+        logger.debug(
+            "Executing dynamic tool '%s' (proxied from %s/%s)",
+            dynamic_tool_name,
+            server_name,
+            tool.name,
+        )
+        try:
+            return await proxied_server.call_tool(
+                plugin_manager=plugin_manager,
+                name=tool.name,
+                arguments=arguments,
+                mcp_context=ctx,  # Pass gateway context
+            )
+        except Exception as e:
+            return _tool_error_result(dynamic_tool_name, error_prefix, e)
+
+    if not param_signatures:
+        # Many tools take no arguments: skip keyword packing for them
+        async def dynamic_tool_impl(ctx=None):
+            return await proxy_call({}, ctx)
+
+    else:
+        # Define the handler with the proper signature
+        # FastMCP passes everything by keyword, so ctx never ends up in tool_kwargs
+        async def dynamic_tool_impl(ctx=None, **tool_kwargs):
+            return await proxy_call(tool_kwargs, ctx)
+
+    # Apply the (shared) signature to the function
+    sig, annotations = _handler_signature(
+        tuple((name, type_ann) for name, type_ann, _ in param_signatures),
+        types.CallToolResult,
+    )
+    dynamic_tool_impl.__signature__ = sig
+    dynamic_tool_impl.__annotations__ = dict(annotations)
+
+    return dynamic_tool_impl
+
+
+def _create_prompt_handler(
+    server_name: str,
+    prompt: types.Prompt,
+    proxied_server: Server,
+    plugin_manager: PluginManager,
+    dynamic_prompt_name: str,
+    param_signatures: List[Tuple[str, Any, Optional[str]]],
+):
+    """Creates a properly typed handler proxying calls to a prompt."""
+    # Formatted once here rather than on every failed call
+    error_prefix = f"Error executing prompt '{dynamic_prompt_name}': "
+
+    # Define the handler with the proper signature
+    # FastMCP passes everything by keyword, so ctx never ends up in prompt_kwargs
+    async def dynamic_prompt_impl(ctx=None, **prompt_kwargs):
+
+        logger.debug(
+            "Executing dynamic prompt '%s' (proxied from %s/%s)",
+            dynamic_prompt_name,
+            server_name,
+            prompt.name,
+        )
+        try:
+            result = await proxied_server.get_prompt(
+                plugin_manager=plugin_manager,
+                name=prompt.name,
+                arguments=prompt_kwargs,
+                mcp_context=ctx,  # Pass gateway context
+            )
+            return result  # Server.get_prompt already wraps sanitization errors
+        except Exception as e:
+            logger.error("%s%s", error_prefix, e, exc_info=True)
+            return types.GetPromptResult(
+                messages=[
+                    types.PromptMessage(
+                        role="assistant",
+                        content=types.TextContent(
+                            type="text", text=error_prefix + str(e)
+                        ),
+                    )
+                ]
+            )
+
+    # Apply the (shared) signature to the function
+    sig, annotations = _handler_signature(
+        tuple((name, type_ann) for name, type_ann, _ in param_signatures),
+        types.GetPromptResult,
+    )
+    dynamic_prompt_impl.__signature__ = sig
+    dynamic_prompt_impl.__annotations__ = dict(annotations)
+
+    return dynamic_prompt_impl
 
-async def register_dynamic_tool(
+
+def register_dynamic_tool(
     gateway_mcp: FastMCP,
     server_name: str,
     tool: types.Tool,
@@ -395,122 +958,50 @@ async def register_dynamic_tool(
     plugin_manager: PluginManager,
 ):
     """Registers a dynamic tool handler directly with the FastMCP instance."""
-    dynamic_tool_name = f"{server_name}_{tool.name}"
+    # Many servers repeat boilerplate names/descriptions; keep one copy each
+    tool.name = _intern(tool.name)
+    tool.description = _intern(tool.description)
+    dynamic_tool_name = _qualified_name(server_name, tool.name)
     logger.debug(f"Attempting to register dynamic tool: {dynamic_tool_name}")
 
     # Extract parameter types from the tool's inputSchema
     param_signatures = []
 
     # Tool has inputSchema (JSON Schema) instead of arguments
-    if hasattr(tool, "inputSchema") and tool.inputSchema:
+    input_schema = getattr(tool, "inputSchema", None)
+    if input_schema:
         # Try to extract properties from JSON Schema
-        properties = tool.inputSchema.get("properties", {})
+        properties = input_schema.get("properties", {})
         for param_name, param_schema in properties.items():
-            param_type = Any  # Default type
             param_description = param_schema.get("description", "")
 
-            # Map JSON Schema types to Python types
-            json_type = param_schema.get("type")
-            if json_type:
-                type_mapping = {
-                    "string": str,
-                    "integer": int,
-                    "boolean": bool,
-                    "number": float,
-                    "object": Dict[str, Any],
-                    "array": List[Any],
-                }
-                param_type = type_mapping.get(json_type, Any)
+            # Map JSON Schema types to Python types (Any by default)
+            param_type = _JSON_TYPE_MAPPING.get(param_schema.get("type"), Any)
 
             param_signatures.append((param_name, param_type, param_description))
 
-    # Create a properly typed dynamic function based on the original tool's signature
-    def create_typed_handler(param_signatures):
-        # Create parameters for the function signature
-        parameters = [
-            inspect.Parameter(
-                name="ctx",
-                annotation=Context,
-                kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
-            )
-        ]
-
-        annotations = {"ctx": Context, "return": types.CallToolResult}
-
-        # Add parameters from the original tool
-        for name, type_ann, description in param_signatures:
-            parameters.append(
-                inspect.Parameter(
-                    name=name,
-                    annotation=type_ann,
-                    kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
-                )
-            )
-            annotations[name] = type_ann
-
-        # Create the proper signature
-        sig = inspect.Signature(parameters=parameters)
-
-        # Define the handler with the proper signature
-        async def dynamic_tool_impl(*args, **kwargs):
-            ctx = kwargs.get("ctx", args[0] if args else None)
-            # Remove ctx from kwargs before passing to the proxied server
-            tool_kwargs = {k: v for k, v in kwargs.items() if k != "ctx"}
-
-            logger.info(
-                f"Executing dynamic tool '{dynamic_tool_name}' (proxied from {server_name}/{tool.name})"
-            )
-            try:
-                result = await proxied_server.call_tool(
-                    plugin_manager=plugin_manager,
-                    name=tool.name,
-                    arguments=tool_kwargs,
-                    mcp_context=ctx,  # Pass gateway context
-                )
-                return result
-            except SanitizationError as se:
-                logger.error(
-                    f"Sanitization policy violation for dynamic tool '{dynamic_tool_name}': {se}"
-                )
-                return types.CallToolResult(
-                    outputs=[
-                        {"type": "error", "message": f"Gateway policy violation: {se}"}
-                    ]
-                )
-            except Exception as e:
-                logger.error(
-                    f"Error executing dynamic tool '{dynamic_tool_name}': {e}",
-                    exc_info=True,
-                )
-                return types.CallToolResult(
-                    outputs=[
-                        {
-                            "type": "error",
-                            "message": f"Error executing dynamic tool '{dynamic_tool_name}': {e}",
-                        }
-                    ]
-                )
-
-        # Apply the signature to the function
-        dynamic_tool_impl.__signature__ = sig
-        dynamic_tool_impl.__annotations__ = annotations
-
-        return dynamic_tool_impl
-
     # Create the handler with proper signature
-    dynamic_tool_impl = create_typed_handler(param_signatures)
+    dynamic_tool_impl = _create_tool_handler(
+        server_name,
+        tool,
+        proxied_server,
+        plugin_manager,
+        dynamic_tool_name,
+        param_signatures,
+    )
 
     # Set metadata properties for FastMCP
     dynamic_tool_impl.__name__ = dynamic_tool_name
-    dynamic_tool_impl.__doc__ = tool.description or f"Proxied tool from {server_name}"
+    dynamic_tool_impl.__doc__ = tool.description or _intern(
+        f"Proxied tool from {server_name}"
+    )
 
     # Register with FastMCP
     try:
-        # Use the full schema to register
-        tool_decorator = gateway_mcp.tool(
-            name=dynamic_tool_name, description=tool.description
+        # Register directly rather than building a throwaway decorator per tool
+        gateway_mcp.add_tool(
+            dynamic_tool_impl, name=dynamic_tool_name, description=tool.description
         )
-        tool_decorator(dynamic_tool_impl)
         logger.info(f"Registered dynamic tool '{dynamic_tool_name}' with FastMCP")
     except Exception as e:
         logger.error(
@@ -519,7 +1010,7 @@ async def register_dynamic_tool(
         )
 
 
-async def register_dynamic_prompt(
+def register_dynamic_prompt(
     gateway_mcp: FastMCP,
     server_name: str,
     prompt: types.Prompt,
@@ -527,100 +1018,48 @@ async def register_dynamic_prompt(
     plugin_manager: PluginManager,
 ):
     """Registers a dynamic prompt handler directly with the FastMCP instance."""
-    dynamic_prompt_name = f"{server_name}_{prompt.name}"
+    # Many servers repeat boilerplate names/descriptions; keep one copy each
+    prompt.name = _intern(prompt.name)
+    prompt.description = _intern(prompt.description)
+    dynamic_prompt_name = _qualified_name(server_name, prompt.name)
     logger.debug(f"Attempting to register dynamic prompt: {dynamic_prompt_name}")
 
     # Extract parameter types from the prompt's arguments
     param_signatures = []
-    if hasattr(prompt, "arguments") and prompt.arguments:
-        for arg in prompt.arguments:
+    prompt_arguments = getattr(prompt, "arguments", None)
+    if prompt_arguments:
+        for arg in prompt_arguments:
             param_type = str  # Default type for prompt arguments is string
             description = getattr(arg, "description", None)
 
             param_signatures.append((arg.name, param_type, description))
 
-    # Create a properly typed dynamic function based on the original prompt's signature
-    def create_typed_handler(param_signatures):
-        # Create parameters for the function signature
-        parameters = [
-            inspect.Parameter(
-                name="ctx",
-                annotation=Context,
-                kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
-            )
-        ]
-
-        annotations = {"ctx": Context, "return": types.GetPromptResult}
-
-        # Add parameters from the original prompt
-        for name, type_ann, description in param_signatures:
-            parameters.append(
-                inspect.Parameter(
-                    name=name,
-                    annotation=type_ann,
-                    kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
-                )
-            )
-            annotations[name] = type_ann
-
-        # Create the proper signature
-        sig = inspect.Signature(parameters=parameters)
-
-        # Define the handler with the proper signature
-        async def dynamic_prompt_impl(*args, **kwargs):
-            ctx = kwargs.get("ctx", args[0] if args else None)
-            # Remove ctx from kwargs before passing to the proxied server
-            prompt_kwargs = {k: v for k, v in kwargs.items() if k != "ctx"}
-
-            logger.info(
-                f"Executing dynamic prompt '{dynamic_prompt_name}' (proxied from {server_name}/{prompt.name})"
-            )
-            try:
-                result = await proxied_server.get_prompt(
-                    plugin_manager=plugin_manager,
-                    name=prompt.name,
-                    arguments=prompt_kwargs,
-                    mcp_context=ctx,  # Pass gateway context
-                )
-                return result  # Server.get_prompt already wraps sanitization errors
-            except Exception as e:
-                logger.error(
-                    f"Error executing dynamic prompt '{dynamic_prompt_name}': {e}",
-                    exc_info=True,
-                )
-                return types.GetPromptResult(
-                    messages=[
-                        types.PromptMessage(
-                            role="assistant",
-                            content=types.TextContent(
-                                type="text",
-                                text=f"Error executing prompt '{dynamic_prompt_name}': {e}",
-                            ),
-                        )
-                    ]
-                )
-
-        # Apply the signature to the function
-        dynamic_prompt_impl.__signature__ = sig
-        dynamic_prompt_impl.__annotations__ = annotations
-
-        return dynamic_prompt_impl
-
     # Create the handler with proper signature
-    dynamic_prompt_impl = create_typed_handler(param_signatures)
+    dynamic_prompt_impl = _create_prompt_handler(
+        server_name,
+        prompt,
+        proxied_server,
+        plugin_manager,
+        dynamic_prompt_name,
+        param_signatures,
+    )
 
     # Set metadata properties for FastMCP
     dynamic_prompt_impl.__name__ = dynamic_prompt_name
-    dynamic_prompt_impl.__doc__ = (
-        prompt.description or f"Proxied prompt from {server_name}"
+    dynamic_prompt_impl.__doc__ = prompt.description or _intern(
+        f"Proxied prompt from {server_name}"
     )
 
     # Register with FastMCP
     try:
-        prompt_decorator = gateway_mcp.prompt(
-            name=dynamic_prompt_name, description=prompt.description
+        # Register directly rather than building a throwaway decorator per prompt
+        gateway_mcp.add_prompt(
+            Prompt.from_function(
+                dynamic_prompt_impl,
+                name=dynamic_prompt_name,
+                description=prompt.description,
+            )
         )
-        prompt_decorator(dynamic_prompt_impl)
         logger.info(f"Registered dynamic prompt '{dynamic_prompt_name}' with FastMCP")
     except Exception as e:
         logger.error(
@@ -629,6 +1068,43 @@ async def register_dynamic_prompt(
         )
 
 
+def _register_server_capabilities(
+    gateway_mcp: FastMCP,
+    server_name: str,
+    proxied_server: Server,
+    plugin_manager: PluginManager,
+) -> Tuple[int, int]:
+    """Registers the cached tools and prompts of one proxied server.
+
+    Returns:
+        The number of tools and prompts registered.
+    """
+    # Register tools for this server
+    for tool in proxied_server.tools:  # Use cached list
+        register_dynamic_tool(
+            gateway_mcp,  # Pass FastMCP instance
+            server_name,
+            tool,
+            proxied_server,
+            plugin_manager,
+        )
+    # Register prompts for this server
+    for prompt in proxied_server.prompts:  # Use cached list
+        register_dynamic_prompt(
+            gateway_mcp,  # Pass FastMCP instance
+            server_name,
+            prompt,
+            proxied_server,
+            plugin_manager,
+        )
+    # Note: Dynamic resource registration is deferred
+    if proxied_server.resources:
+        logger.warning(
+            f"Dynamic resource registration for server '{server_name}' is not yet implemented. Resources will not be exposed via gateway."
+        )
+    return len(proxied_server.tools), len(proxied_server.prompts)
+
+
 async def register_proxied_capabilities(gateway_mcp: FastMCP, context: GetewayContext):
     """Fetches capabilities from proxied servers and registers them dynamically with the gateway_mcp."""
     logger.info("Dynamically registering capabilities from proxied servers...")
@@ -639,48 +1115,23 @@ async def register_proxied_capabilities(gateway_mcp: FastMCP, context: GetewayCo
         )
         return
 
-    registration_tasks = []
     registered_tool_count = 0
     registered_prompt_count = 0
 
+    # Registration is pure CPU work, so register inline rather than gathering
     for server_name, proxied_server in context.proxied_servers.items():
-        if proxied_server.session:  # Only register for active sessions
-            # Register tools for this server
-            for tool in proxied_server._tools:  # Use cached list
-                registration_tasks.append(
-                    register_dynamic_tool(
-                        gateway_mcp,  # Pass FastMCP instance
-                        server_name,
-                        tool,
-                        proxied_server,
-                        plugin_manager,
-                    )
-                )
-                registered_tool_count += 1
-            # Register prompts for this server
-            for prompt in proxied_server._prompts:  # Use cached list
-                registration_tasks.append(
-                    register_dynamic_prompt(
-                        gateway_mcp,  # Pass FastMCP instance
-                        server_name,
-                        prompt,
-                        proxied_server,
-                        plugin_manager,
-                    )
-                )
-                registered_prompt_count += 1
-            # Note: Dynamic resource registration is deferred
-            if proxied_server._resources:
-                logger.warning(
-                    f"Dynamic resource registration for server '{server_name}' is not yet implemented. Resources will not be exposed via gateway."
-                )
+        if proxied_server.is_active:  # Only register for active sessions
+            tool_count, prompt_count = _register_server_capabilities(
+                gateway_mcp, server_name, proxied_server, plugin_manager
+            )
+            registered_tool_count += tool_count
+            registered_prompt_count += prompt_count
         else:
             logger.warning(
                 f"Skipping dynamic registration for inactive server: {server_name}"
             )
 
-    if registration_tasks:
-        await asyncio.gather(*registration_tasks)
+    if registered_tool_count or registered_prompt_count:
         logger.info(
             f"Dynamic registration process complete. Attempted to register {registered_tool_count} tools and {registered_prompt_count} prompts with FastMCP."
         )
@@ -688,9 +1139,92 @@ async def register_proxied_capabilities(gateway_mcp: FastMCP, context: GetewayCo
         logger.info("No active proxied servers found or no capabilities to register.")
 
 
+async def reregister_proxied_capabilities(
+    gateway_mcp: FastMCP,
+    context: GetewayContext,
+    proxied_server: Server,
+    previous_tools: Tuple[types.Tool, ...],
+    previous_prompts: Tuple[types.Prompt, ...],
+) -> None:
+    """Replaces one server's registered capabilities after they changed.
+
+    Used when capabilities were served from the disk cache and the background
+    refresh found different ones.
+
+    Args:
+        gateway_mcp: The gateway FastMCP instance.
+        context: The gateway context holding the list snapshots.
+        proxied_server: The server whose capabilities changed.
+        previous_tools: The tools registered for the server so far.
+        previous_prompts: The prompts registered for the server so far.
+    """
+    # Before the initial registration there is nothing to replace: it reads
+    # the refreshed lists itself. After shutdown there is nothing to update.
+    if context.gateway_tools_snapshot is None:
+        return
+    server_name = proxied_server.name
+    # FastMCP has no public API to remove capabilities, so drop the stale
+    # entries from its managers before registering the refreshed lists
+    registered_tools = gateway_mcp._tool_manager._tools
+    for tool in previous_tools:
+        registered_tools.pop(_qualified_name(server_name, tool.name), None)
+    registered_prompts = gateway_mcp._prompt_manager._prompts
+    for prompt in previous_prompts:
+        registered_prompts.pop(_qualified_name(server_name, prompt.name), None)
+
+    _register_server_capabilities(
+        gateway_mcp, server_name, proxied_server, context.plugin_manager
+    )
+    context.gateway_tools_snapshot = tuple(await gateway_mcp.list_tools())
+    context.gateway_prompts_snapshot = tuple(await gateway_mcp.list_prompts())
+
+
 # --- Lifespan Management ---
 
 
+def _start_concurrency() -> int:
+    """Returns how many proxied servers may be started concurrently."""
+    value = os.environ.get(START_CONCURRENCY_ENV, "")
+    try:
+        return max(int(value), 1) if value else DEFAULT_START_CONCURRENCY
+    except ValueError:
+        logger.warning("Ignoring invalid %s value: %r", START_CONCURRENCY_ENV, value)
+        return DEFAULT_START_CONCURRENCY
+
+
+async def _shutdown_proxied_servers(context: GetewayContext) -> None:
+    """Stops every active proxied server, each bounded by SHUTDOWN_TIMEOUT.
+
+    Args:
+        context: The gateway context holding the proxied servers.
+    """
+    logger.info("MCP gateway lifespan shutting down...")
+    context.gateway_tools_snapshot = None
+    context.gateway_prompts_snapshot = None
+    # Stop only the servers that were successfully started
+    # A wedged server must not stall the whole gateway shutdown
+    stopping = [
+        (name, asyncio.wait_for(server.stop(), SHUTDOWN_TIMEOUT))
+        for name, server in context.proxied_servers.items()
+        if server.is_active
+    ]
+    if stopping:
+        results = await asyncio.gather(
+            *(stop for _, stop in stopping), return_exceptions=True
+        )
+        for (name, _), result in zip(stopping, results):
+            if isinstance(result, asyncio.TimeoutError):
+                logger.error(
+                    "Proxied server '%s' did not stop within %.1fs; abandoning it.",
+                    name,
+                    SHUTDOWN_TIMEOUT,
+                )
+            elif isinstance(result, BaseException):
+                logger.error("Error stopping proxied server '%s': %s", name, result)
+        logger.info("All active proxied servers stopped.")
+    logger.info("MCP gateway shutdown complete.")
+
+
 @asynccontextmanager
 async def lifespan(server: FastMCP) -> AsyncIterator[GetewayContext]:
     """Manages the lifecycle of proxied MCP servers and dynamic registration."""
@@ -704,10 +1238,8 @@ async def lifespan(server: FastMCP) -> AsyncIterator[GetewayContext]:
     # Handle the unified plugin parameter and plugin type discovery
     if cli_args and cli_args.plugin:
         # Import the necessary functions from the plugin manager
-        from mcp_gateway.plugins.manager import get_plugin_type, discover_plugins
-
-        # Ensure plugins are discovered
-        discover_plugins()
+        # get_plugin_type imports only the modules of the requested plugins
+        from mcp_gateway.plugins.manager import get_plugin_type
 
         for plugin_name in cli_args.plugin:
             # Get the plugin type using the plugin name
@@ -750,64 +1282,86 @@ async def lifespan(server: FastMCP) -> AsyncIterator[GetewayContext]:
     proxied_server_configs = load_config(cli_args.mcp_json_path)
 
     # Initialize context
-    context = GetewayContext(plugin_manager=plugin_manager)
-
-    # Create Server instances but don't start them yet
-    for name, server_config in proxied_server_configs.items():
-        logger.info(f"Creating client instance for proxied server: {name}")
-        proxied_server = Server(name, server_config)
-        context.proxied_servers[name] = proxied_server
-
-    # Start all servers concurrently
-    if context.proxied_servers:
-        logger.info("Starting all configured proxied servers...")
-        start_tasks = [
-            asyncio.create_task(server.start())
-            for server in context.proxied_servers.values()
-        ]
-        if start_tasks:
-            results = await asyncio.gather(*start_tasks, return_exceptions=True)
-            # Check results for errors during startup
+    context = GetewayContext(
+        plugin_manager=plugin_manager,
+        configured_server_names=tuple(proxied_server_configs),
+    )
+
+    # Cleanup is registered before any server starts, so servers are stopped
+    # even if startup or registration fails before the context is yielded
+    async with AsyncExitStack() as gateway_stack:
+        gateway_stack.push_async_callback(_shutdown_proxied_servers, context)
+
+        # Create Server instances but don't start them yet
+        for name, server_config in proxied_server_configs.items():
+            logger.info(f"Creating client instance for proxied server: {name}")
+            proxied_server = Server(name, server_config)
+            # Wired before start() schedules the background refresh, so a
+            # refresh that finishes early still reaches the gateway
+            proxied_server.on_capabilities_refreshed = functools.partial(
+                reregister_proxied_capabilities, server, context
+            )
+            context.proxied_servers[name] = proxied_server
+
+        # Start all servers concurrently
+        if context.proxied_servers:
+            logger.info("Starting all configured proxied servers...")
+            # Bound concurrent spawns so large configs don't fork-storm at boot
+            start_slots = asyncio.Semaphore(_start_concurrency())
+            # Each start records its own failure, so no results need scanning
             failed_servers = []
-            for i, result in enumerate(results):
-                server_name = list(context.proxied_servers.keys())[i]
-                if isinstance(result, Exception):
+            # Tracebacks are only attached to startup errors when debugging
+            debug_enabled = logger.isEnabledFor(logging.DEBUG)
+
+            async def guarded_start(server_name: str, proxied_server: Server) -> None:
+                try:
+                    async with start_slots:
+                        await proxied_server.start()
+                except Exception as e:
                     logger.error(
-                        f"Failed to start server '{server_name}' during gather: {result}",
-                        exc_info=result if logger.isEnabledFor(logging.DEBUG) else None,
+                        f"Failed to start server '{server_name}' during startup: {e}",
+                        exc_info=e if debug_enabled else None,
                     )
                     failed_servers.append(server_name)
                 else:
                     logger.info(f"Successfully started server '{server_name}'.")
 
+            # gather wraps the coroutines in tasks itself
+            await asyncio.gather(
+                *(
+                    guarded_start(name, server)
+                    for name, server in context.proxied_servers.items()
+                )
+            )
+
             # Remove failed servers from context so we don't try to register them
-            for name in failed_servers:
-                context.proxied_servers.pop(name, None)
+            if failed_servers:
+                failed = frozenset(failed_servers)
+                context.proxied_servers = {
+                    name: server
+                    for name, server in context.proxied_servers.items()
+                    if name not in failed
+                }
 
             logger.info("Attempted to start all configured proxied servers.")
-    else:
-        logger.warning(
-            "No proxied MCP servers configured. Running in standalone mode (plugins still active)."
-        )
 
-    # Register capabilities from proxied servers
-    await register_proxied_capabilities(server, context)
+            # Wait for the capability fetches scheduled by each start()
+            await asyncio.gather(
+                *(server.ready() for server in context.proxied_servers.values())
+            )
+        else:
+            logger.warning(
+                "No proxied MCP servers configured. Running in standalone mode (plugins still active)."
+            )
+
+        # Register capabilities from proxied servers
+        await register_proxied_capabilities(server, context)
+        # The registry no longer changes, so list requests can share one snapshot
+        context.gateway_tools_snapshot = tuple(await server.list_tools())
+        context.gateway_prompts_snapshot = tuple(await server.list_prompts())
 
-    try:
         # Yield the context containing servers and plugin manager
         yield context
-    finally:
-        logger.info("MCP gateway lifespan shutting down...")
-        # Stop only the servers that were successfully started
-        stop_tasks = [
-            asyncio.create_task(server.stop())
-            for name, server in context.proxied_servers.items()
-            if server._session is not None  # Check if session was ever active
-        ]
-        if stop_tasks:
-            await asyncio.gather(*stop_tasks, return_exceptions=True)
-            logger.info("All active proxied servers stopped.")
-        logger.info("MCP gateway shutdown complete.")
 
 
 # Initialize the MCP gateway server
@@ -818,102 +1372,444 @@ mcp = FastMCP("MCP Gateway", lifespan=lifespan, version="1.0.0")
 # --- Gateway's Own Capability Implementations ---
 
 
-@mcp.tool()  # Keep get_metadata as it provides original server details
-async def get_metadata(ctx: Context) -> Dict[str, Any]:
-    """Provides metadata about all available proxied MCPs, including their original capabilities."""
-    geteway_context: GetewayContext = ctx.request_context.lifespan_context
-    metadata: Dict[str, Any] = {}
+async def _server_metadata(name: str, server: Optional[Server]) -> Dict[str, Any]:
+    """Builds the get_metadata entry for one configured server.
+
+    Args:
+        name: The configured server name.
+        server: The running Server, or None if it failed to start.
+
+    Returns:
+        The server's metadata; errors are reported inside the entry.
+    """
+    server_metadata: Dict[str, Any] = {
+        "status": "inactive",
+        "capabilities": None,
+        "original_tools": [],
+        "original_resources": [],
+        "original_prompts": [],
+    }
+
+    if not server or not server.is_active:
+        server_metadata["error"] = "Server session not active or start failed"
+        return server_metadata
+
+    # Reuse the entry built earlier while the server's capabilities are
+    # unchanged; the TTL bounds staleness should a change go unnoticed
+    now = time.monotonic()
+    cached = server._metadata_cache
+    if (
+        cached is not None
+        and cached[0] == server._capabilities_version
+        and now - cached[1] < METADATA_CACHE_TTL
+    ):
+        return cached[2]
+
+    try:
+        server_metadata["status"] = "active"
+        # 1. Get Capabilities
+        capabilities = await server.get_capabilities()  # Use the stored capabilities
+        server_metadata["capabilities"] = server._capabilities_dump
+
+        # 2. List Original Tools (use cached list)
+        if capabilities and capabilities.tools:
+            server_metadata["original_tools"] = server._tools_dump
+        else:
+            logger.debug(
+                "Server '%s' does not support tools, skipping list_tools in metadata.",
+                name,
+            )
+
+        # 3. List Original Resources (use cached list)
+        if capabilities and capabilities.resources:
+            server_metadata["original_resources"] = server._resources_dump
+        else:
+            logger.debug(
+                "Server '%s' does not support resources, skipping list_resources in metadata.",
+                name,
+            )
+
+        # 4. List Original Prompts (use cached list)
+        if capabilities and capabilities.prompts:
+            server_metadata["original_prompts"] = server._prompts_dump
+        else:
+            logger.debug(
+                "Server '%s' does not support prompts, skipping list_prompts in metadata.",
+                name,
+            )
+
+        server._metadata_cache = (
+            server._capabilities_version,
+            now,
+            server_metadata,
+        )
+
+    except Exception as e:
+        # Catch general errors during metadata retrieval for this specific server
+        # A broken server may be polled often; format its traceback at most
+        # once per interval
+        with_traceback = (
+            now - server._metadata_traceback_logged_at
+            >= METADATA_ERROR_TRACEBACK_INTERVAL
+        )
+        if with_traceback:
+            server._metadata_traceback_logged_at = now
+        logger.error(
+            "General error getting metadata for server '%s': %s",
+            name,
+            e,
+            exc_info=with_traceback,
+        )
+        return {
+            "status": "error",
+            "error": f"Failed to retrieve metadata: {e}",
+            "capabilities": server_metadata.get(
+                "capabilities"
+            ),  # Include caps if fetched before error
+            "original_tools": server_metadata.get("original_tools", []),
+            "original_resources": server_metadata.get("original_resources", []),
+            "original_prompts": server_metadata.get("original_prompts", []),
+        }
+
+    return server_metadata
+
+
+# get_metadata sections and the entry keys they control
+_METADATA_SECTIONS = MappingProxyType(
+    {
+        "capabilities": "capabilities",
+        "tools": "original_tools",
+        "resources": "original_resources",
+        "prompts": "original_prompts",
+    }
+)
+
+
+async def _full_metadata(geteway_context: GetewayContext) -> Dict[str, Any]:
+    """Returns the metadata entries of every configured server.
+
+    The result may be the shared snapshot, so callers must not mutate it.
+
+    Args:
+        geteway_context: The gateway context holding the proxied servers.
+
+    Returns:
+        Dict mapping each configured server name to its metadata entry.
+    """
+    # Cover *all* configured servers, even if start failed, to report status;
+    # resolve each name to its server once for both passes below
+    names = geteway_context.configured_server_names
+    servers = geteway_context.proxied_servers
+    pairs = [(name, servers.get(name)) for name in names]
+
+    # Reuse the last full result while no server's capabilities changed
+    versions = tuple(
+        getattr(server, "_capabilities_version", None) for _, server in pairs
+    )
+    now = time.monotonic()
+    snapshot = geteway_context.metadata_snapshot
+    if (
+        snapshot is not None
+        and snapshot[0] == versions
+        and now - snapshot[1] < METADATA_CACHE_TTL
+    ):
+        return snapshot[2]
+
+    # Entries come from cached data without I/O, so build them in order;
+    # each one handles its own errors
+    entries = [await _server_metadata(name, server) for name, server in pairs]
+    metadata = dict(zip(names, entries))
+    # Transient errors are retried on the next call rather than cached
+    if all(entry.get("status") != "error" for entry in entries):
+        geteway_context.metadata_snapshot = (versions, now, metadata)
+    return metadata
+
+
+async def collect_metadata(
+    geteway_context: GetewayContext, include: Optional[List[str]] = None
+) -> Dict[str, Any]:
+    """Builds the get_metadata result for the proxied servers.
+
+    Args:
+        geteway_context: The gateway context holding the proxied servers.
+        include: Sections to return (any of "capabilities", "tools",
+            "resources", "prompts"); all of them when None.
+
+    Returns:
+        Dict mapping each configured server name to its metadata, or a
+        status dict in standalone mode or for unknown sections.
+    """
+    excluded_keys: Tuple[str, ...] = ()
+    if include is not None:
+        unknown = set(include) - _METADATA_SECTIONS.keys()
+        if unknown:
+            return {
+                "status": "error",
+                "error": f"Unknown metadata sections: {sorted(unknown)}. "
+                f"Valid sections: {list(_METADATA_SECTIONS)}",
+            }
+        excluded_keys = tuple(
+            key for section, key in _METADATA_SECTIONS.items() if section not in include
+        )
 
     if not geteway_context.proxied_servers:
         return {"status": "standalone_mode", "message": "No proxied MCPs configured"}
 
-    # Iterate through potentially *all* configured servers, even if start failed, to report status
-    all_configured_servers = load_config(
-        cli_args.mcp_json_path if cli_args else None
-    )  # Reload to get names if needed
-    if not all_configured_servers:
-        all_configured_servers = {}  # Handle case where config path is missing
-
-    for name in all_configured_servers.keys():
-        server = geteway_context.proxied_servers.get(name)
-        server_metadata: Dict[str, Any] = {
-            "status": "inactive",
-            "capabilities": None,
-            "original_tools": [],
-            "original_resources": [],
-            "original_prompts": [],
+    metadata = await _full_metadata(geteway_context)
+    if excluded_keys:
+        # Entries are shared with the caches, so filter into copies
+        return {
+            name: {
+                key: value for key, value in entry.items() if key not in excluded_keys
+            }
+            for name, entry in metadata.items()
         }
+    # Shallow copy so the shared snapshot never leaves this function
+    return metadata.copy()
 
-        if not server or not server.session:
-            server_metadata["error"] = "Server session not active or start failed"
-            metadata[name] = server_metadata
-            continue
 
-        try:
-            server_metadata["status"] = "active"
-            # 1. Get Capabilities
-            capabilities = (
-                await server.get_capabilities()
-            )  # Use the stored capabilities
-            server_metadata["capabilities"] = (
-                capabilities.model_dump() if capabilities else None
-            )
-
-            # 2. List Original Tools (use cached list)
-            if capabilities and capabilities.tools:
-                server_metadata["original_tools"] = [
-                    tool.model_dump() for tool in server._tools
-                ]
-            else:
-                logger.debug(
-                    f"Server '{name}' does not support tools, skipping list_tools in metadata."
-                )
+def _json_content(value: Any) -> types.TextContent:
+    """Serializes a tool result to JSON text content in one pydantic-core call.
 
-            # 3. List Original Resources (use cached list)
-            if capabilities and capabilities.resources:
-                server_metadata["original_resources"] = [
-                    res.model_dump() for res in server._resources
-                ]
-            else:
-                logger.debug(
-                    f"Server '{name}' does not support resources, skipping list_resources in metadata."
-                )
+    Indented like FastMCP's own rendering of dict results, so clients see the
+    same layout get_metadata always returned.
+    """
+    return types.TextContent(
+        type="text",
+        text=pydantic_core.to_json(value, indent=2, fallback=str).decode(),
+    )
 
-            # 4. List Original Prompts (use cached list)
-            if capabilities and capabilities.prompts:
-                server_metadata["original_prompts"] = [
-                    p.model_dump() for p in server._prompts
-                ]
-            else:
-                logger.debug(
-                    f"Server '{name}' does not support prompts, skipping list_prompts in metadata."
-                )
 
-            metadata[name] = server_metadata
+@mcp.tool()  # Keep get_metadata as it provides original server details
+async def get_metadata(
+    ctx: Context, include: Optional[List[str]] = None
+) -> types.TextContent:
+    """Provides metadata about all available proxied MCPs, including their original capabilities.
+
+    Pass include (any of "capabilities", "tools", "resources", "prompts") to
+    only return those sections; all of them are returned by default.
+    """
+    geteway_context: GetewayContext = _lifespan_context(ctx)
+    if include is not None or not geteway_context.proxied_servers:
+        return _json_content(await collect_metadata(geteway_context, include))
+
+    # The full result is served as JSON rendered once per snapshot, so
+    # repeated calls skip re-serializing every server's capabilities
+    metadata = await _full_metadata(geteway_context)
+    rendered = geteway_context.metadata_content
+    if rendered is None or rendered[0] is not metadata:
+        rendered = (metadata, _json_content(metadata))
+        geteway_context.metadata_content = rendered
+    return rendered[1]
+
+
+def _batch_error(message: str) -> types.CallToolResult:
+    """Builds the error result for a batched call that could not run."""
+    return types.CallToolResult(
+        content=[types.TextContent(type="text", text=message)], isError=True
+    )
 
-        except Exception as e:
-            # Catch general errors during metadata retrieval for this specific server
-            logger.error(
-                f"General error getting metadata for server '{name}': {e}",
-                exc_info=True,
-            )
-            metadata[name] = {
-                "status": "error",
-                "error": f"Failed to retrieve metadata: {e}",
-                "capabilities": server_metadata.get(
-                    "capabilities"
-                ),  # Include caps if fetched before error
-                "original_tools": server_metadata.get("original_tools", []),
-                "original_resources": server_metadata.get("original_resources", []),
-                "original_prompts": server_metadata.get("original_prompts", []),
+
+@functools.lru_cache(maxsize=256)
+def _unknown_server_result(server_name: str) -> types.CallToolResult:
+    """Returns the (shared) error result for a call to an unknown server.
+
+    Cached so a client repeatedly naming a bad server doesn't build a new
+    result model every time; batch results are only ever dumped, never mutated.
+    """
+    return _batch_error(f"Unknown or inactive server '{server_name}'")
+
+
+def _result_text(result: types.CallToolResult) -> str:
+    """Joins the text content of a tool result, used to feed dependent calls."""
+    return "\n".join(
+        item.text for item in result.content if isinstance(item, types.TextContent)
+    )
+
+
+def _batch_call_error(call: Any) -> Optional[str]:
+    """Checks the shape of one batched call.
+
+    Args:
+        call: One entry of the batch as sent by the client.
+
+    Returns:
+        A message describing the first problem found, or None if it is valid.
+    """
+    if not isinstance(call, dict):
+        return f"Each call must be an object, got {type(call).__name__}"
+    call_id = call.get("call_id")
+    if not isinstance(call_id, str) or not call_id:
+        return f"Missing or invalid call_id: {call_id!r}"
+    for key in ("server", "tool"):
+        if not isinstance(call.get(key), str):
+            return f"Call '{call_id}' has a missing or invalid {key}: {call.get(key)!r}"
+    arguments = call.get("arguments")
+    if arguments is not None and not isinstance(arguments, dict):
+        return f"Call '{call_id}' has non-object arguments"
+    input_from = call.get("input_from")
+    if input_from is not None and not (
+        isinstance(input_from, dict)
+        and all(
+            isinstance(name, str) and isinstance(source, str)
+            for name, source in input_from.items()
+        )
+    ):
+        return (
+            f"Call '{call_id}' has an input_from that is not a name-to-call_id object"
+        )
+    return None
+
+
+async def _run_batch_call(
+    geteway_context: GetewayContext,
+    call: Dict[str, Any],
+    results: Dict[str, types.CallToolResult],
+    mcp_context: Optional[Context],
+) -> types.CallToolResult:
+    """Runs one call of a batch once the calls it takes input from are done."""
+    server_name, tool_name = call.get("server"), call.get("tool")
+    server = geteway_context.proxied_servers.get(server_name)
+    if server is None:
+        return _unknown_server_result(str(server_name))
+
+    # Calls without arguments share the read-only empty mapping
+    arguments: Mapping[str, Any] = call.get("arguments") or _EMPTY
+    input_from = call.get("input_from")
+    if input_from:
+        # Copy only when outputs of earlier calls are merged in, so neither
+        # the caller's arguments nor _EMPTY are ever modified
+        arguments = dict(arguments)
+        for arg_name, source_id in input_from.items():
+            source = results[source_id]
+            if source.isError:
+                return _batch_error(f"Input call '{source_id}' failed")
+            arguments[arg_name] = _result_text(source)
+
+    try:
+        return await server.call_tool(
+            plugin_manager=geteway_context.plugin_manager,
+            name=tool_name,
+            arguments=arguments,
+            mcp_context=mcp_context,
+        )
+    except Exception as e:
+        logger.error(
+            "Error executing batched call %s/%s: %s",
+            server_name,
+            tool_name,
+            e,
+            exc_info=True,
+        )
+        return _batch_error(f"Error executing '{server_name}/{tool_name}': {e}")
+
+
+async def run_batch(
+    geteway_context: GetewayContext,
+    calls: List[Dict[str, Any]],
+    mcp_context: Optional[Context] = None,
+) -> Dict[str, Any]:
+    """Runs a dependency graph of proxied tool calls layer by layer.
+
+    Calls without pending inputs run concurrently, so a chain of dependent
+    calls costs one round trip per level instead of one per call.
+
+    Args:
+        geteway_context: The gateway context holding the proxied servers.
+        calls: Call dicts with "call_id", "server", "tool", optional
+            "arguments" and optional "input_from" mapping argument names to
+            the call_id whose text output fills them.
+        mcp_context: Optional MCP context passed on to the plugins.
+
+    Returns:
+        A dict mapping each call_id to its dumped CallToolResult, or a dict
+        with an "error" key if the batch itself is invalid.
+    """
+    calls_by_id: Dict[str, Dict[str, Any]] = {}
+    for call in calls:
+        error = _batch_call_error(call)
+        if error is not None:
+            return {"error": error}
+        call_id = call["call_id"]
+        if call_id in calls_by_id:
+            return {"error": f"Duplicate call_id: {call_id!r}"}
+        calls_by_id[call_id] = call
+
+    pending = {
+        call_id: set((call.get("input_from") or _EMPTY).values())
+        for call_id, call in calls_by_id.items()
+    }
+    for call_id, sources in pending.items():
+        unknown = sources - calls_by_id.keys()
+        if unknown:
+            return {
+                "error": f"Call '{call_id}' takes input from unknown calls: {sorted(unknown)}"
             }
 
-    return metadata
+    results: Dict[str, types.CallToolResult] = {}
+    while pending:
+        layer = [
+            call_id for call_id, sources in pending.items() if sources <= results.keys()
+        ]
+        if not layer:
+            return {
+                "error": f"Cyclic input_from references between calls: {sorted(pending)}"
+            }
+        layer_results = await asyncio.gather(
+            *(
+                _run_batch_call(
+                    geteway_context, calls_by_id[call_id], results, mcp_context
+                )
+                for call_id in layer
+            )
+        )
+        for call_id, result in zip(layer, layer_results):
+            results[call_id] = result
+            del pending[call_id]
+
+    return {
+        call_id: result.model_dump(mode="json") for call_id, result in results.items()
+    }
+
+
+@mcp.tool()
+async def batch_call_tools(calls: List[Dict[str, Any]], ctx: Context) -> Dict[str, Any]:
+    """Runs several proxied tool calls in one request.
+
+    Each call is an object with "call_id", "server" (the proxied MCP name),
+    "tool" (the tool name on that server), optional "arguments", and optional
+    "input_from" mapping argument names to the call_id whose text output
+    should be passed in. Independent calls run concurrently; a call runs once
+    every call it takes input from has finished. Returns each call's result
+    keyed by call_id.
+    """
+    geteway_context: GetewayContext = _lifespan_context(ctx)
+    return await run_batch(geteway_context, calls, ctx)
+
+
+# Serve tools/list and prompts/list from the lifespan snapshots instead of
+# rebuilding the listing from FastMCP's registry on every request.
+@mcp._mcp_server.list_tools()
+async def gateway_list_tools() -> Sequence[types.Tool]:
+    """Lists the gateway's tools, including the proxied ones."""
+    geteway_context: GetewayContext = _lifespan_context(mcp._mcp_server)
+    if geteway_context.gateway_tools_snapshot is None:
+        return await mcp.list_tools()
+    return geteway_context.gateway_tools_snapshot
+
+
+@mcp._mcp_server.list_prompts()
+async def gateway_list_prompts() -> Sequence[types.Prompt]:
+    """Lists the gateway's prompts, including the proxied ones."""
+    geteway_context: GetewayContext = _lifespan_context(mcp._mcp_server)
+    if geteway_context.gateway_prompts_snapshot is None:
+        return await mcp.list_prompts()
+    return geteway_context.gateway_prompts_snapshot
 
 
 # --- Argument Parsing & Main ---
-def parse_args(args=None):
-    """Parses command-line arguments."""
+def _build_parser() -> argparse.ArgumentParser:
+    """Builds the command-line argument parser."""
     parser = argparse.ArgumentParser(description="MCP Gateway Server")
     parser.add_argument(
         "--mcp-json-path",
@@ -946,29 +1842,61 @@ def parse_args(args=None):
         const="all",
         default=[],
     )
+    return parser
+
+
+# Built once and reused by every parse_args call
+_PARSER = _build_parser()
+
+
+def parse_args(args=None):
+    """Parses command-line arguments."""
     if args is None:
         args = sys.argv[1:]
 
-    parsed_args = parser.parse_args(args)
+    parsed_args = _PARSER.parse_args(args)
+    # The list may be the parser's shared default, so copy before extending it
+    parsed_args.plugin = list(parsed_args.plugin)
 
     # Simplify backward compatibility by adding enable-guardrails and enable-tracing values to plugin list
-    for guardrail in parsed_args.enable_guardrails:
-        if guardrail and guardrail not in parsed_args.plugin:
-            parsed_args.plugin.append(guardrail)
-            logger.info(f"Adding backward compatibility guardrail plugin: {guardrail}")
-
-    for tracing in parsed_args.enable_tracing:
-        if tracing and tracing not in parsed_args.plugin:
-            parsed_args.plugin.append(tracing)
-            logger.info(f"Adding backward compatibility tracing plugin: {tracing}")
+    seen = set(parsed_args.plugin)
+    for plugin_kind, plugin_names in (
+        ("guardrail", parsed_args.enable_guardrails),
+        ("tracing", parsed_args.enable_tracing),
+    ):
+        for plugin_name in plugin_names:
+            if plugin_name and plugin_name not in seen:
+                seen.add(plugin_name)
+                parsed_args.plugin.append(plugin_name)
+                logger.info(
+                    "Adding backward compatibility %s plugin: %s",
+                    plugin_kind,
+                    plugin_name,
+                )
 
     return parsed_args
 
 
+def _install_uvloop() -> None:
+    """Switches asyncio to uvloop when it is installed (not available on Windows)."""
+    if sys.platform == "win32":
+        return
+    try:
+        import uvloop
+    except ImportError:
+        return
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    logger.info("Using uvloop event loop.")
+
+
 def main():
     global cli_args
+    _configure_logging()
     cli_args = parse_args()
 
+    # Must happen before mcp.run() creates the event loop
+    _install_uvloop()
+
     logger.info("Starting MCP gateway server directly...")
     mcp.run()
 
@@ -0,0 +1,44 @@
+"""Tests for the on-disk capability cache."""
+
+import os
+from pathlib import Path
+
+import pytest
+from mcp import types
+
+from mcp_gateway import cache
+
+CONFIG = {"command": "npx", "args": ["server"], "env": {"TOKEN": "x"}}
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Point the cache at a temporary directory."""
+    monkeypatch.setattr(cache, "CACHE_DIR", tmp_path)
+    return tmp_path
+
+
+def test_round_trip(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Saved capabilities load back as MCP models while fresh."""
+    monkeypatch.setenv(cache.CACHE_TTL_ENV, "3600")
+    tool = types.Tool(name="echo", inputSchema={"type": "object"})
+    prompt = types.Prompt(name="greet")
+
+    cache.save_capabilities(CONFIG, [tool], [], [prompt])
+
+    assert cache.load_capabilities(CONFIG) == ([tool], [], [prompt])
+    assert cache.load_capabilities({**CONFIG, "args": ["other"]}) is None
+
+
+def test_expired_or_disabled(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Expired entries and a disabled cache are misses."""
+    monkeypatch.setenv(cache.CACHE_TTL_ENV, "60")
+    cache.save_capabilities(CONFIG, [], [], [])
+    path = cache.cache_path(CONFIG)
+    os.utime(path, (0, 0))
+
+    assert cache.load_capabilities(CONFIG) is None
+
+    monkeypatch.delenv(cache.CACHE_TTL_ENV)
+    os.utime(path)
+    assert cache.load_capabilities(CONFIG) is None
@@ -1,14 +1,16 @@
 import pytest
 import logging
-from typing import Dict, List, Set
+from collections import Counter
+from typing import Dict, List
 from mcp_gateway.plugins.manager import (
     _PLUGIN_REGISTRY,
     _PLUGIN_NAME_TO_INFO,
+    PluginInfo,
     discover_plugins,
 )
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def plugin_registry() -> Dict[str, List]:
     """
     Fixture providing access to the plugin registry.
@@ -21,8 +23,8 @@ def plugin_registry() -> Dict[str, List]:
     return _PLUGIN_REGISTRY
 
 
-@pytest.fixture(scope="module")
-def plugin_name_mapping() -> Dict[str, Dict]:
+@pytest.fixture(scope="session")
+def plugin_name_mapping() -> Dict[str, PluginInfo]:
     """
     Fixture providing access to the plugin name to class mapping.
 
@@ -35,7 +37,7 @@ def plugin_name_mapping() -> Dict[str, Dict]:
 
 
 def test_no_duplicate_plugin_names(
-    plugin_registry: Dict[str, List], plugin_name_mapping: Dict[str, Dict]
+    plugin_registry: Dict[str, List], plugin_name_mapping: Dict[str, PluginInfo]
 ) -> None:
     """
     Test that there are no plugins with the same name.
@@ -53,21 +55,13 @@ def test_no_duplicate_plugin_names(
         if not plugins:
             continue
 
-        # Get plugin names for this type
-        plugin_names: Set[str] = set()
-        duplicate_names: List[str] = []
+        # Get plugin names for this type (resolved and lowercased at registration)
+        plugin_names = [plugin_cls._resolved_name for plugin_cls in plugins]
 
-        for plugin_cls in plugins:
-            # Get plugin name (lowercase for case-insensitive comparison)
-            plugin_name = getattr(plugin_cls, "plugin_name", "").lower()
-            if not plugin_name:
-                plugin_name = plugin_cls.__name__.lower()
-
-            # Check for duplicates
-            if plugin_name in plugin_names:
-                duplicate_names.append(plugin_name)
-            else:
-                plugin_names.add(plugin_name)
+        # Check for duplicates
+        duplicate_names: List[str] = [
+            name for name, count in Counter(plugin_names).items() if count > 1
+        ]
 
         # Assert no duplicates found
         assert not duplicate_names, (
@@ -75,13 +69,8 @@ def test_no_duplicate_plugin_names(
         )
 
     # Check the name-to-info mapping for any inconsistencies
-    plugin_classes = set()
-    for plugin_name, info in plugin_name_mapping.items():
-        plugin_class = info.get("class")
-        if plugin_class in plugin_classes:
-            # This is fine as the same class can be registered with multiple names
-            continue
-        plugin_classes.add(plugin_class)
+    # (the same class can be registered under multiple names)
+    plugin_classes = {info.plugin_class for info in plugin_name_mapping.values()}
 
     # Log the successful validation
     logging.info(
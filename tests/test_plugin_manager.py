@@ -0,0 +1,286 @@
+"""Tests for PluginManager request/response dispatch."""
+
+import asyncio
+from typing import Any, Dict, List, Optional
+
+import pytest
+
+from mcp_gateway.plugins.base import GuardrailPlugin, PluginContext, TracingPlugin
+from mcp_gateway.plugins.manager import (
+    _PLUGIN_REGISTRY,
+    PluginInfo,
+    PluginManager,
+    discover_plugins,
+)
+
+
+class AppendGuardrail(GuardrailPlugin):
+    """Sync guardrail that appends its tag to the 'seen' argument."""
+
+    plugin_name = "test-append"
+
+    def load(self, config: Optional[Dict[str, Any]] = None) -> None:
+        pass
+
+    def process_request(self, context: PluginContext) -> Optional[Dict[str, Any]]:
+        return {"seen": context.arguments["seen"] + ["sync"]}
+
+    def process_response(self, context: PluginContext) -> Any:
+        return context.response + ["sync"]
+
+
+class AsyncAppendGuardrail(GuardrailPlugin):
+    """Async guardrail that appends its tag to the 'seen' argument."""
+
+    plugin_name = "test-async-append"
+
+    def load(self, config: Optional[Dict[str, Any]] = None) -> None:
+        pass
+
+    async def process_request(self, context: PluginContext) -> Optional[Dict[str, Any]]:
+        return {"seen": context.arguments["seen"] + ["async"]}
+
+    async def process_response(self, context: PluginContext) -> Any:
+        return context.response + ["async"]
+
+
+class BlockingGuardrail(GuardrailPlugin):
+    """Guardrail that blocks every request."""
+
+    plugin_name = "test-block"
+
+    def load(self, config: Optional[Dict[str, Any]] = None) -> None:
+        pass
+
+    def process_request(self, context: PluginContext) -> Optional[Dict[str, Any]]:
+        return None
+
+    def process_response(self, context: PluginContext) -> Any:
+        return context.response
+
+
+class RecordingTracer(TracingPlugin):
+    """Tracing plugin that records the contexts it observes."""
+
+    plugin_name = "test-recorder"
+    events: List[tuple] = []
+
+    def load(self, config: Optional[Dict[str, Any]] = None) -> None:
+        pass
+
+    def process_request(self, context: PluginContext) -> Optional[Dict[str, Any]]:
+        RecordingTracer.events.append(("request", context.arguments))
+        return context.arguments
+
+    def process_response(self, context: PluginContext) -> Any:
+        RecordingTracer.events.append(("response", context.response))
+        return context.response
+
+
+class FailingTracer(TracingPlugin):
+    """Async tracing plugin that always raises."""
+
+    plugin_name = "test-failing"
+
+    def load(self, config: Optional[Dict[str, Any]] = None) -> None:
+        pass
+
+    async def process_request(self, context: PluginContext) -> Optional[Dict[str, Any]]:
+        raise RuntimeError("boom")
+
+    async def process_response(self, context: PluginContext) -> Any:
+        raise RuntimeError("boom")
+
+
+class WaitingTracer(TracingPlugin):
+    """Async tracing plugin that waits for SignallingTracer to run."""
+
+    plugin_name = "test-waiting"
+    signal: Optional[asyncio.Event] = None
+
+    def load(self, config: Optional[Dict[str, Any]] = None) -> None:
+        pass
+
+    async def process_request(self, context: PluginContext) -> Optional[Dict[str, Any]]:
+        await WaitingTracer.signal.wait()
+        return context.arguments
+
+    async def process_response(self, context: PluginContext) -> Any:
+        return context.response
+
+
+class SignallingTracer(TracingPlugin):
+    """Async tracing plugin that releases WaitingTracer."""
+
+    plugin_name = "test-signalling"
+
+    def load(self, config: Optional[Dict[str, Any]] = None) -> None:
+        pass
+
+    async def process_request(self, context: PluginContext) -> Optional[Dict[str, Any]]:
+        WaitingTracer.signal.set()
+        return context.arguments
+
+    async def process_response(self, context: PluginContext) -> Any:
+        return context.response
+
+
+def make_manager(
+    monkeypatch: pytest.MonkeyPatch,
+    guardrails: List[type],
+    tracers: List[type],
+) -> PluginManager:
+    """Build a PluginManager whose registry only holds the given test plugins."""
+    # Import built-in plugins first so they don't register into the test lists
+    discover_plugins()
+    monkeypatch.setitem(_PLUGIN_REGISTRY, GuardrailPlugin.plugin_type, guardrails)
+    monkeypatch.setitem(_PLUGIN_REGISTRY, TracingPlugin.plugin_type, tracers)
+    return PluginManager(
+        enabled_types=[GuardrailPlugin.plugin_type, TracingPlugin.plugin_type]
+    )
+
+
+def make_context(**kwargs: Any) -> PluginContext:
+    """Build a PluginContext for a test tool call."""
+    return PluginContext(
+        server_name="test_server",
+        capability_type="tool",
+        capability_name="test_tool",
+        **kwargs,
+    )
+
+
+@pytest.fixture(autouse=True)
+def reset_events() -> None:
+    """Clear events recorded by RecordingTracer between tests."""
+    RecordingTracer.events = []
+
+
+@pytest.mark.asyncio
+async def test_guardrails_chain_in_registration_order(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Sync and async guardrails run in order, each seeing the previous output."""
+    manager = make_manager(
+        monkeypatch, [AppendGuardrail, AsyncAppendGuardrail, AppendGuardrail], []
+    )
+
+    result = await manager.process_request(make_context(arguments={"seen": []}))
+    assert result == {"seen": ["sync", "async", "sync"]}
+
+    response = await manager.process_response(make_context(response=[]))
+    assert response == ["sync", "async", "sync"]
+
+
+@pytest.mark.asyncio
+async def test_blocking_guardrail_returns_none(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A guardrail returning None blocks the request for later plugins too."""
+    manager = make_manager(monkeypatch, [BlockingGuardrail, AppendGuardrail], [])
+
+    result = await manager.process_request(make_context(arguments={"seen": []}))
+    assert result is None
+
+
+@pytest.mark.asyncio
+async def test_tracing_errors_do_not_break_dispatch(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Failing tracing plugins are logged and skipped."""
+    manager = make_manager(
+        monkeypatch, [AppendGuardrail], [FailingTracer, RecordingTracer]
+    )
+
+    result = await manager.process_request(make_context(arguments={"seen": []}))
+    assert result == {"seen": ["sync"]}
+
+    response = await manager.process_response(make_context(response=[]))
+    assert response == ["sync"]
+    assert RecordingTracer.events == [
+        ("request", {"seen": []}),
+        ("response", ["sync"]),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_no_plugins_passes_through() -> None:
+    """Without loaded plugins, requests and responses are returned unchanged."""
+    manager = PluginManager()
+    arguments = {"seen": []}
+
+    assert await manager.process_request(make_context(arguments=arguments)) is arguments
+    assert await manager.process_response(make_context(response=["r"])) == ["r"]
+
+
+@pytest.mark.asyncio
+async def test_async_tracing_plugins_run_concurrently(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Async tracing hooks don't wait on each other."""
+    WaitingTracer.signal = asyncio.Event()
+    manager = make_manager(monkeypatch, [], [WaitingTracer, SignallingTracer])
+
+    result = await asyncio.wait_for(
+        manager.process_request(make_context(arguments={"seen": []})), timeout=1
+    )
+    assert result == {"seen": []}
+
+
+def test_only_enabled_plugins_are_loaded(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Plugins are matched by plugin_name or class name, case-insensitively."""
+    discover_plugins()
+    monkeypatch.setitem(
+        _PLUGIN_REGISTRY,
+        GuardrailPlugin.plugin_type,
+        [AppendGuardrail, AsyncAppendGuardrail, BlockingGuardrail],
+    )
+    manager = PluginManager(
+        enabled_types=[GuardrailPlugin.plugin_type],
+        enabled_plugins={
+            GuardrailPlugin.plugin_type: ["TEST-APPEND", "blockingguardrail"]
+        },
+    )
+
+    loaded = manager.get_plugins(GuardrailPlugin.plugin_type)
+    assert [type(plugin) for plugin in loaded] == [AppendGuardrail, BlockingGuardrail]
+
+
+def test_sanitizer_flags_track_hooked_phases(monkeypatch: pytest.MonkeyPatch) -> None:
+    """has_*_sanitizers are only set for phases that have hooks."""
+    manager = PluginManager()
+    assert not manager.has_request_sanitizers
+    assert not manager.has_response_sanitizers
+
+    manager = make_manager(monkeypatch, [AppendGuardrail], [])
+    assert manager.has_request_sanitizers
+    assert manager.has_response_sanitizers
+
+
+def test_pipeline_skips_phases_without_hooks(monkeypatch: pytest.MonkeyPatch) -> None:
+    """get_pipeline only returns hooks for phases that plugins hook."""
+    assert PluginManager().get_pipeline("s", "tool", "t") == ((), ())
+
+    manager = make_manager(monkeypatch, [AppendGuardrail], [])
+    request_hooks, response_hooks = manager.get_pipeline("s", "tool", "t")
+    assert [hook.__func__ for hook in request_hooks] == [
+        AppendGuardrail.process_request
+    ]
+    assert [hook.__func__ for hook in response_hooks] == [
+        AppendGuardrail.process_response
+    ]
+    assert manager.get_pipeline("s", "tool", "t") is manager.get_pipeline(
+        "s", "prompt", "p"
+    )
+
+
+def test_plugin_info_keeps_dict_style_access() -> None:
+    """Registry entries still answer the keys of the former dict entries."""
+    info = PluginInfo(
+        plugin_type=GuardrailPlugin.plugin_type, plugin_class=AppendGuardrail
+    )
+
+    assert info["type"] == GuardrailPlugin.plugin_type
+    assert info["class"] is AppendGuardrail
+    with pytest.raises(KeyError):
+        info["schema"]
@@ -0,0 +1,633 @@
+"""Tests for the proxied Server session lifecycle."""
+
+import asyncio
+import functools
+import inspect
+import json
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional
+
+import pytest
+from mcp import types
+from mcp.shared.memory import create_connected_server_and_client_session
+
+import mcp_gateway.server as server_module
+from mcp_gateway.cache import CACHE_TTL_ENV
+from mcp_gateway.plugins.manager import PluginManager
+from mcp_gateway.server import Server
+
+
+class FakeSession:
+    """Stands in for ClientSession, recording the calls it receives."""
+
+    def __init__(self, read: Any = None, write: Any = None):
+        self.calls: List[tuple] = []
+
+    async def __aenter__(self) -> "FakeSession":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        pass
+
+    async def initialize(self) -> types.InitializeResult:
+        return types.InitializeResult(
+            protocolVersion="2024-11-05",
+            capabilities=types.ServerCapabilities(),
+            serverInfo=types.Implementation(name="fake", version="0"),
+        )
+
+    async def list_tools(self) -> types.ListToolsResult:
+        return types.ListToolsResult(tools=[])
+
+    async def list_resources(self) -> types.ListResourcesResult:
+        return types.ListResourcesResult(resources=[])
+
+    async def list_prompts(self) -> types.ListPromptsResult:
+        return types.ListPromptsResult(prompts=[])
+
+    async def call_tool(
+        self, name: str, arguments: Optional[Dict[str, Any]] = None
+    ) -> types.CallToolResult:
+        self.calls.append((name, arguments))
+        return types.CallToolResult(content=[types.TextContent(type="text", text="ok")])
+
+
+@pytest.fixture
+def spawns(monkeypatch: pytest.MonkeyPatch) -> List[Any]:
+    """Replace stdio_client/ClientSession with fakes and record each spawn."""
+    spawned: List[Any] = []
+
+    @asynccontextmanager
+    async def fake_stdio_client(server_params: Any):
+        spawned.append(server_params)
+        await asyncio.sleep(0)
+        yield None, None
+
+    monkeypatch.setattr(server_module, "stdio_client", fake_stdio_client)
+    monkeypatch.setattr(server_module, "ClientSession", FakeSession)
+    return spawned
+
+
+@pytest.mark.asyncio
+async def test_concurrent_connects_spawn_once(spawns: List[Any]) -> None:
+    """Concurrent first callers share a single server process."""
+    server = Server("test", {"command": "fake"})
+
+    sessions = await asyncio.gather(server.connect(), server.connect())
+    await server.ready()
+
+    assert len(spawns) == 1
+    assert sessions[0] is sessions[1]
+
+    await server.disconnect()
+    await server.disconnect()
+    assert server._session is None
+
+
+@pytest.mark.asyncio
+async def test_call_tool_reuses_session(spawns: List[Any]) -> None:
+    """call_tool must never open a new stdio_client per call."""
+    server = Server("test", {"command": "fake"})
+    await server.start()
+    await server.ready()
+    session = server._session
+
+    for _ in range(3):
+        await server.call_tool(PluginManager(), "echo", {"text": "hi"})
+
+    assert len(spawns) == 1
+    assert session.calls == [("echo", {"text": "hi"})] * 3
+
+    await server.stop()
+
+
+@pytest.mark.asyncio
+async def test_connect_waits_for_initialized_session(
+    spawns: List[Any], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A second connect() never returns a session still initializing."""
+    initialized: List[FakeSession] = []
+    proceed = asyncio.Event()
+
+    class SlowSession(FakeSession):
+        async def initialize(self) -> types.InitializeResult:
+            await proceed.wait()
+            initialized.append(self)
+            return await super().initialize()
+
+    monkeypatch.setattr(server_module, "ClientSession", SlowSession)
+    server = Server("test", {"command": "fake"})
+
+    first = asyncio.create_task(server.connect())
+    await asyncio.sleep(0.01)
+    assert not server.is_active
+    second = asyncio.create_task(server.connect())
+    await asyncio.sleep(0)
+    proceed.set()
+
+    sessions = await asyncio.gather(first, second)
+    assert sessions[0] is sessions[1] is initialized[0]
+
+    await server.stop()
+
+
+@pytest.mark.asyncio
+async def test_stopped_server_does_not_respawn(spawns: List[Any]) -> None:
+    """Calls arriving after stop() fail instead of starting a new process."""
+    server = Server("test", {"command": "fake"})
+    await server.start()
+    await server.ready()
+    await server.stop()
+
+    with pytest.raises(RuntimeError, match="stopped"):
+        await server.call_tool(PluginManager(), "echo", {"text": "hi"})
+    assert len(spawns) == 1
+
+    # An explicit connect() still starts the server again
+    await server.connect()
+    assert len(spawns) == 2
+    await server.stop()
+
+
+@pytest.mark.asyncio
+async def test_session_contexts_stay_in_one_task(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """The stdio client is exited from the task that entered it."""
+    tasks: List[Optional[asyncio.Task]] = []
+
+    @asynccontextmanager
+    async def fake_stdio_client(server_params: Any):
+        tasks.append(asyncio.current_task())
+        yield None, None
+        tasks.append(asyncio.current_task())
+
+    monkeypatch.setattr(server_module, "stdio_client", fake_stdio_client)
+    monkeypatch.setattr(server_module, "ClientSession", FakeSession)
+    server = Server("test", {"command": "fake"})
+
+    # Connect and disconnect from two different short-lived tasks
+    await asyncio.create_task(server.connect())
+    await asyncio.create_task(server.stop())
+
+    assert len(tasks) == 2
+    assert tasks[0] is tasks[1]
+
+
+@pytest.mark.asyncio
+async def test_calls_never_connect_lazily(spawns: List[Any]) -> None:
+    """A call on a server that was never started fails without spawning."""
+    server = Server("test", {"command": "fake"})
+
+    with pytest.raises(RuntimeError, match="not connected"):
+        await server.call_tool(PluginManager(), "echo", {"text": "hi"})
+    assert spawns == []
+
+
+class EchoServer:
+    """Proxied server stand-in that echoes its arguments as text."""
+
+    def __init__(self, started: List[str]):
+        self.started = started
+
+    async def call_tool(
+        self,
+        plugin_manager: Any,
+        name: str,
+        arguments: Dict[str, Any],
+        mcp_context: Any = None,
+    ) -> types.CallToolResult:
+        self.started.append(name)
+        await asyncio.sleep(0)
+        text = f"{name}({','.join(f'{k}={v}' for k, v in sorted(arguments.items()))})"
+        return types.CallToolResult(content=[types.TextContent(type="text", text=text)])
+
+
+@pytest.mark.asyncio
+async def test_run_batch_feeds_outputs_to_dependent_calls() -> None:
+    """Independent calls run in the first layer, dependents get their output."""
+    started: List[str] = []
+    context = server_module.GetewayContext(proxied_servers={"srv": EchoServer(started)})
+
+    results = await server_module.run_batch(
+        context,
+        [
+            {
+                "call_id": "c",
+                "server": "srv",
+                "tool": "join",
+                "input_from": {"x": "a", "y": "b"},
+            },
+            {"call_id": "a", "server": "srv", "tool": "ls"},
+            {"call_id": "b", "server": "srv", "tool": "pwd", "arguments": {"v": 1}},
+        ],
+    )
+
+    assert started == ["ls", "pwd", "join"]
+    assert results["c"]["content"][0]["text"] == "join(x=ls(),y=pwd(v=1))"
+    assert not results["c"]["isError"]
+
+
+@pytest.mark.asyncio
+async def test_run_batch_rejects_cycles_and_reports_unknown_servers() -> None:
+    """Cyclic batches are rejected; calls to unknown servers fail individually."""
+    context = server_module.GetewayContext(proxied_servers={"srv": EchoServer([])})
+
+    cyclic = await server_module.run_batch(
+        context,
+        [
+            {"call_id": "a", "server": "srv", "tool": "t", "input_from": {"x": "b"}},
+            {"call_id": "b", "server": "srv", "tool": "t", "input_from": {"x": "a"}},
+        ],
+    )
+    assert "error" in cyclic
+
+    results = await server_module.run_batch(
+        context,
+        [
+            {"call_id": "a", "server": "missing", "tool": "t"},
+            {"call_id": "b", "server": "srv", "tool": "t", "input_from": {"x": "a"}},
+        ],
+    )
+    assert results["a"]["isError"] and results["b"]["isError"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "call",
+    [
+        "not a call",
+        {"call_id": ["a"], "server": "srv", "tool": "t"},
+        {"call_id": "a", "server": ["srv"], "tool": "t"},
+        {"call_id": "a", "server": "srv", "tool": "t", "arguments": ["x"]},
+        {"call_id": "a", "server": "srv", "tool": "t", "input_from": ["b"]},
+        {"call_id": "a", "server": "srv", "tool": "t", "input_from": {"x": ["b"]}},
+    ],
+)
+async def test_run_batch_rejects_malformed_calls(call: Any) -> None:
+    """Malformed calls are reported as a batch error instead of raising."""
+    context = server_module.GetewayContext(proxied_servers={"srv": EchoServer([])})
+
+    result = await server_module.run_batch(context, [call])
+
+    assert set(result) == {"error"}
+
+
+@pytest.mark.asyncio
+async def test_get_metadata_reuses_entries_until_capabilities_change(
+    spawns: List[Any],
+) -> None:
+    """Per-server metadata is rebuilt only when the server's capabilities change."""
+    server = Server("srv", {"command": "fake"})
+    await server.start()
+    await server.ready()
+    context = server_module.GetewayContext(
+        proxied_servers={"srv": server}, configured_server_names=("srv", "down")
+    )
+
+    first = await server_module.collect_metadata(context)
+    second = await server_module.collect_metadata(context)
+    assert first["srv"]["status"] == "active"
+    assert first["down"]["status"] == "inactive"
+    assert second["srv"] is first["srv"]
+
+    server._capabilities_version += 1
+    third = await server_module.collect_metadata(context)
+    assert third["srv"] is not first["srv"]
+    assert third["srv"] == first["srv"]
+
+    await server.stop()
+
+
+@pytest.mark.asyncio
+async def test_get_metadata_include_filters_sections(spawns: List[Any]) -> None:
+    """Only the requested metadata sections are returned."""
+    server = Server("srv", {"command": "fake"})
+    await server.start()
+    await server.ready()
+    context = server_module.GetewayContext(
+        proxied_servers={"srv": server}, configured_server_names=("srv",)
+    )
+
+    metadata = await server_module.collect_metadata(context, include=["tools"])
+    assert set(metadata["srv"]) == {"status", "original_tools"}
+
+    full = await server_module.collect_metadata(context)
+    assert "original_prompts" in full["srv"]
+
+    error = await server_module.collect_metadata(context, include=["bogus"])
+    assert error["status"] == "error"
+
+    await server.stop()
+
+
+@pytest.mark.asyncio
+async def test_get_metadata_reuses_rendered_json(spawns: List[Any]) -> None:
+    """The full metadata is serialized once and served until it changes."""
+    server = Server("srv", {"command": "fake"})
+    await server.start()
+    await server.ready()
+    context = server_module.GetewayContext(
+        proxied_servers={"srv": server}, configured_server_names=("srv",)
+    )
+    ctx = SimpleNamespace(request_context=SimpleNamespace(lifespan_context=context))
+
+    first = await server_module.get_metadata(ctx)
+    second = await server_module.get_metadata(ctx)
+    assert second is first
+    metadata = await server_module.collect_metadata(context)
+    assert first.text == json.dumps(metadata, indent=2)
+
+    server._capabilities_version += 1
+    assert await server_module.get_metadata(ctx) is not first
+
+    filtered = await server_module.get_metadata(ctx, include=["tools"])
+    assert set(json.loads(filtered.text)["srv"]) == {"status", "original_tools"}
+
+    await server.stop()
+
+
+@pytest.mark.asyncio
+async def test_list_tools_served_from_snapshot(
+    tmp_path: Any, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """tools/list returns the snapshot taken when the lifespan started."""
+    config_path = tmp_path / "mcp.json"
+    config_path.write_text('{"mcpServers": {}}')
+    monkeypatch.setattr(
+        server_module,
+        "cli_args",
+        SimpleNamespace(mcp_json_path=str(config_path), plugin=[]),
+    )
+    gateway = server_module.mcp
+    builds: List[int] = []
+    build_listing = gateway.list_tools
+
+    async def counting_list_tools() -> List[types.Tool]:
+        builds.append(1)
+        return await build_listing()
+
+    monkeypatch.setattr(gateway, "list_tools", counting_list_tools)
+
+    async with create_connected_server_and_client_session(
+        gateway._mcp_server
+    ) as client:
+        first = await client.list_tools()
+        second = await client.list_tools()
+
+    assert "get_metadata" in {tool.name for tool in first.tools}
+    assert second.tools == first.tools
+    assert len(builds) == 1
+
+
+def test_fastmcp_internals_used_by_the_gateway() -> None:
+    """Fails if the private FastMCP attributes the gateway relies on move.
+
+    tools/list and prompts/list are served by handlers installed on
+    _mcp_server, and re-registration edits the tool and prompt managers'
+    name-keyed dicts; none of these are public FastMCP API.
+    """
+    handlers = server_module.mcp._mcp_server.request_handlers
+    assert types.ListToolsRequest in handlers
+    assert types.ListPromptsRequest in handlers
+
+    gateway = server_module.FastMCP("test")
+
+    async def tool() -> str:
+        return "ok"
+
+    gateway.add_tool(tool, name="srv_t")
+    gateway.add_prompt(server_module.Prompt.from_function(tool, name="srv_p"))
+    assert list(gateway._tool_manager._tools) == ["srv_t"]
+    assert list(gateway._prompt_manager._prompts) == ["srv_p"]
+
+
+@pytest.mark.asyncio
+async def test_tool_handler_wraps_errors_in_error_result() -> None:
+    """A failing proxied call is returned as an error result, not raised."""
+
+    class FailingServer:
+        async def call_tool(self, **kwargs: Any) -> types.CallToolResult:
+            raise RuntimeError("boom")
+
+    handler = server_module._create_tool_handler(
+        "srv",
+        types.Tool(name="t", inputSchema={}),
+        FailingServer(),
+        PluginManager(),
+        "srv_t",
+        [],
+    )
+
+    result = await handler()
+
+    assert result.isError
+    assert result.content[0].text == "Error executing dynamic tool 'srv_t': boom"
+
+
+@pytest.mark.asyncio
+async def test_zero_parameter_tool_is_called_through_fastmcp() -> None:
+    """Tools without parameters get a handler taking only the context."""
+    calls: List[Dict[str, Any]] = []
+
+    class RecordingServer:
+        async def call_tool(self, **kwargs: Any) -> types.CallToolResult:
+            calls.append(kwargs["arguments"])
+            return types.CallToolResult(
+                content=[types.TextContent(type="text", text="ok")]
+            )
+
+    gateway = server_module.FastMCP("test")
+    server_module.register_dynamic_tool(
+        gateway,
+        "srv",
+        types.Tool(name="t", inputSchema={"type": "object", "properties": {}}),
+        RecordingServer(),
+        PluginManager(),
+    )
+
+    handler = gateway._tool_manager.get_tool("srv_t").fn
+    assert list(inspect.signature(handler).parameters) == ["ctx"]
+    await gateway.call_tool("srv_t", {})
+    assert calls == [{}]
+
+
+@pytest.mark.asyncio
+async def test_only_advertised_capabilities_are_listed(
+    spawns: List[Any], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Categories missing from the initialize result are never listed."""
+    listed: List[str] = []
+
+    class ToolsOnlySession(FakeSession):
+        async def initialize(self) -> types.InitializeResult:
+            result = await super().initialize()
+            result.capabilities.tools = types.ToolsCapability()
+            return result
+
+        async def list_tools(self) -> types.ListToolsResult:
+            listed.append("tools")
+            return await super().list_tools()
+
+        async def list_prompts(self) -> types.ListPromptsResult:
+            listed.append("prompts")
+            return await super().list_prompts()
+
+    monkeypatch.setattr(server_module, "ClientSession", ToolsOnlySession)
+    server = Server("srv", {"command": "fake"})
+    await server.start()
+    await server.ready()
+
+    assert listed == ["tools"]
+
+    await server.stop()
+
+
+@pytest.mark.asyncio
+async def test_refreshed_cached_capabilities_are_reregistered(
+    spawns: List[Any], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A refresh that changes cached capabilities replaces the registered tools."""
+    listed = asyncio.Event()
+
+    class RefreshedSession(FakeSession):
+        async def initialize(self) -> types.InitializeResult:
+            result = await super().initialize()
+            result.capabilities.tools = types.ToolsCapability()
+            return result
+
+        async def list_tools(self) -> types.ListToolsResult:
+            await listed.wait()
+            return types.ListToolsResult(tools=[types.Tool(name="new", inputSchema={})])
+
+    stale = types.Tool(name="old", inputSchema={})
+    monkeypatch.setenv(CACHE_TTL_ENV, "60")
+    monkeypatch.setattr(server_module, "ClientSession", RefreshedSession)
+    monkeypatch.setattr(
+        server_module, "load_capabilities", lambda config: ([stale], [], [])
+    )
+    monkeypatch.setattr(server_module, "save_capabilities", lambda *args: None)
+
+    gateway = server_module.FastMCP("test")
+    server = Server("srv", {"command": "fake"})
+    context = server_module.GetewayContext(
+        proxied_servers={"srv": server}, plugin_manager=PluginManager()
+    )
+    await server.start()
+    await server.ready()
+    await server_module.register_proxied_capabilities(gateway, context)
+    server.on_capabilities_refreshed = functools.partial(
+        server_module.reregister_proxied_capabilities, gateway, context
+    )
+    context.gateway_tools_snapshot = tuple(await gateway.list_tools())
+    assert [tool.name for tool in context.gateway_tools_snapshot] == ["srv_old"]
+
+    listed.set()
+    await server._capabilities_task
+
+    assert [tool.name for tool in context.gateway_tools_snapshot] == ["srv_new"]
+    assert [tool.name for tool in await gateway.list_tools()] == ["srv_new"]
+
+    await server.stop()
+
+
+@pytest.mark.asyncio
+async def test_failed_listing_is_not_cached(
+    spawns: List[Any], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Capabilities are only written to the disk cache when every list succeeded."""
+    saved: List[tuple] = []
+    failing = {"list_tools": True}
+
+    class FlakySession(FakeSession):
+        async def initialize(self) -> types.InitializeResult:
+            result = await super().initialize()
+            result.capabilities.tools = types.ToolsCapability()
+            return result
+
+        async def list_tools(self) -> types.ListToolsResult:
+            if failing["list_tools"]:
+                raise RuntimeError("listing failed")
+            return await super().list_tools()
+
+    monkeypatch.setenv(CACHE_TTL_ENV, "60")
+    monkeypatch.setattr(server_module, "ClientSession", FlakySession)
+    monkeypatch.setattr(server_module, "load_capabilities", lambda config: None)
+    monkeypatch.setattr(
+        server_module, "save_capabilities", lambda *args: saved.append(args)
+    )
+
+    server = Server("test", {"command": "fake"})
+    await server.start()
+    await server.ready()
+    await server.stop()
+    assert saved == []
+
+    failing["list_tools"] = False
+    await server.start()
+    await server.ready()
+    await server.stop()
+    assert len(saved) == 1
+
+
+@pytest.mark.asyncio
+async def test_refresh_before_registration_is_picked_up(
+    spawns: List[Any], monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
+) -> None:
+    """A refresh finishing before registration needs no restart."""
+
+    class RefreshedSession(FakeSession):
+        async def initialize(self) -> types.InitializeResult:
+            result = await super().initialize()
+            result.capabilities.tools = types.ToolsCapability()
+            return result
+
+        async def list_tools(self) -> types.ListToolsResult:
+            return types.ListToolsResult(tools=[types.Tool(name="new", inputSchema={})])
+
+    stale = types.Tool(name="old", inputSchema={})
+    monkeypatch.setenv(CACHE_TTL_ENV, "60")
+    monkeypatch.setattr(server_module, "ClientSession", RefreshedSession)
+    monkeypatch.setattr(
+        server_module, "load_capabilities", lambda config: ([stale], [], [])
+    )
+    monkeypatch.setattr(server_module, "save_capabilities", lambda *args: None)
+
+    gateway = server_module.FastMCP("test")
+    server = Server("srv", {"command": "fake"})
+    context = server_module.GetewayContext(
+        proxied_servers={"srv": server}, plugin_manager=PluginManager()
+    )
+    server.on_capabilities_refreshed = functools.partial(
+        server_module.reregister_proxied_capabilities, gateway, context
+    )
+    await server.start()
+    await server._capabilities_task
+    await server_module.register_proxied_capabilities(gateway, context)
+
+    assert [tool.name for tool in await gateway.list_tools()] == ["srv_new"]
+    assert "restart" not in caplog.text
+
+    await server.stop()
+
+
+@pytest.mark.asyncio
+async def test_run_batch_shares_empty_arguments() -> None:
+    """Calls without arguments or inputs get the shared empty mapping."""
+    received: List[Any] = []
+
+    class RecordingServer(EchoServer):
+        async def call_tool(
+            self, plugin_manager: Any, name: str, arguments: Any, **kwargs: Any
+        ):
+            received.append(arguments)
+            return await super().call_tool(plugin_manager, name, arguments)
+
+    context = server_module.GetewayContext(proxied_servers={"srv": RecordingServer([])})
+    await server_module.run_batch(
+        context, [{"call_id": "a", "server": "srv", "tool": "t"}]
+    )
+
+    assert received == [server_module._EMPTY]
+    assert received[0] is server_module._EMPTY